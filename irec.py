@@ -1,24 +1,272 @@
-import docx
 import re
+from bisect import bisect_left
 from datetime import datetime, timedelta
-from typing import List, Dict, Tuple, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Dict, Set, Tuple, Optional
 import uuid
 
+if TYPE_CHECKING:
+    import docx
+
+_MDY_FORMAT = "%m/%d/%Y"
+_CITI_VALIDITY = timedelta(days=3*365)
+
+# Patterns are compiled once at import time; flags are fixed here rather than at each call site.
+
+_WORD_RE = re.compile(r"\w+")
+_EMAIL_RE = re.compile(r".+@.+\..+")
+_CHECKBOX_RE = re.compile(r"(?:Yes|No) [☑☐]")
+_NA_CHECKBOX_RE = re.compile(r"N/A [☑☐]")
+
+# Section headers in document order: (key, start marker, end marker, message when missing). Part 8 runs up to Part 10.
+_SECTIONS = [
+    ("Part 0", "Part 0: Do I Submit an NU IREC Application?", "Part 1: Cover Sheet", "Part 0 section not found."),
+    ("Part 1", "Part 1: Cover Sheet", "Part 2: Research Team Details", "Part 1: Cover Sheet section not found."),
+    ("Part 2", "Part 2: Research Team Details", "Part 3: Research Design", "Part 2: Research Team Details section not found."),
+    ("Part 3", "Part 3: Research Design", "Part 4: Participants", "Part 3: Research Design section not found."),
+    ("Part 4", "Part 4: Participants", "Part 5: Detailed Procedures", "Part 4: Participants section not found."),
+    ("Part 5", "Part 5: Detailed Procedures", "Part 6: Data Management Plan", "Part 5: Detailed Procedures section not found."),
+    ("Part 6", "Part 6: Data Management Plan", "Part 7: Risk/Benefit Analysis", "Part 6: Data Management Plan section not found."),
+    ("Part 7", "Part 7: Risk/Benefit Analysis", "Part 8: Confidentiality/Anonymity", "Part 7: Risk/Benefit Analysis section not found."),
+    ("Part 8", "Part 8: Confidentiality/Anonymity", "Part 10: Project Funding", "Part 8: Confidentiality/Anonymity section not found."),
+    ("Part 10", "Part 10: Project Funding", "Part 11: Protocol for naming of documents", "Part 10: Project Funding section not found."),
+    ("Part 11", "Part 11: Protocol for naming of documents", None, "Part 11: Protocol for naming of documents section not found.")
+]
+_SECTION_MARKERS = {marker for _, start, end, _ in _SECTIONS for marker in (start, end) if marker}
+# One alternation finds every header in a paragraph in a single scan instead of one `in` test per marker
+_SECTION_MARKER_RE = re.compile("|".join(re.escape(marker) for marker in sorted(_SECTION_MARKERS, key=len, reverse=True)))
+_MISSING_SECTION_MESSAGES = {key: message for key, _, _, message in _SECTIONS}
+
+# Part 0
+def _yes(answer: str) -> bool:
+    return answer.startswith("Yes")
+
+def _no(answer: str) -> bool:
+    return answer.startswith("No")
+
+def _any(answer: str) -> bool:
+    return True
+
+# (question text, prompt to locate, whether the answer means an application is needed)
+_PART0_QUESTIONS = (
+    ("Does your research involve human subjects?", "Does your research involve human subjects", _yes),
+    ("Is this project being conducted solely to fulfill course requirements?", "Is this project being conducted solely to fulfill course requirements", _no),
+    ("Is this project a quality assurance activity?", "Is this project a quality assurance activity", _no),
+    ("Would you like to use this study to launch future investigations?", "Would you like to use this study to launch future investigations", _yes),
+    ("Would you like to disseminate or publish findings?", "Would you like to disseminate or publish findings", _yes),
+    ("Do you think this research is eligible for an Exemption?", "Do you think this research is eligible for an Exemption", _any)
+)
+_EXEMPTION_JUSTIFICATION_PROMPT = "Outline the reasons why your study should be considered exempt:"
+_EXEMPTION_CATS = [
+    ("f1", re.compile(r"f1 (☑|☐) Research conducted in established or commonly accepted educational settings")),
+    ("f2", re.compile(r"f2 (☑|☐) Research involving the use of educational tests")),
+    ("f3", re.compile(r"f3 (☑|☐) Research involving the collection or study of existing data"))
+]
+
+# Part 1
+_PART1_FIELDS = [
+    ("Principal Investigator:", re.compile(r"Principal Investigator:\s*([^\n]+)")),
+    ("Application Date:", re.compile(r"Application Date:\s*([^\n]+)")),
+    ("Nazarbayev University Unit \(School\):", re.compile(r"Nazarbayev University Unit \(School\):\s*([^\n]+)")),
+    ("Primary Research Discipline:", re.compile(r"Primary Research Discipline:\s*([^\n]+)")),
+    ("Application Title:", re.compile(r"Application Title:\s*([^\n]+)"))
+]
+_REVIEW_TYPES = ("An Expedited Review", "A Full Board Review", "An Exemption")
+
+# Part 2
+_PI_HEADER = "Principal Investigator"
+_RA_HEADER = "Research Advisor:"
+_AI_HEADER = "Additional Investigator(s):"
+_STUDENTS_HEADER = "For students:"
+_CITI_STATUS_PROMPT = "Have you completed the CITI basic course"
+# (reported field name, form label, is e-mail, is CITI completion date) for each team member
+_PI_FIELDS = [
+    ("PI Name:", "Name", False, False),
+    ("PI NU ID:", "NU ID", False, False),
+    ("PI NU School:", "NU School", False, False),
+    ("PI Department:", "Department", False, False),
+    ("PI Position:", "Position", False, False),
+    ("PI E-mail address:", "E-mail address", True, False),
+    ("PI Daytime Phone:", "Daytime Phone", False, False),
+    ("PI Mobile phone:", "Mobile phone", False, False),
+    ("PI CITI Training completion date:", "CITI Training completion date", False, True)
+]
+_RA_FIELDS = [
+    ("RA Name:", "Name", False, False),
+    ("RA NU ID:", "NU ID", False, False),
+    ("RA NU School:", "NU School", False, False),
+    ("RA Department:", "Department", False, False),
+    ("RA Position:", "Position", False, False),
+    ("RA E-mail address:", "E-mail address", True, False),
+    ("RA CITI or alternative training completion date:", "CITI or alternative training completion date", False, True)
+]
+_AI_FIELDS = [
+    ("AI Name", "Name", False, False),
+    ("AI NU ID", "NU ID", False, False),
+    ("AI NU School", "NU School", False, False),
+    ("AI Department", "Department", False, False),
+    ("AI Position", "Position", False, False),
+    ("AI E-mail address", "E-mail address", True, False),
+    ("AI CITI or alternative training completion date", "CITI or alternative training completion date", False, True)
+]
+_STUDENT_SECTION_RE = re.compile(r"For students:\s*\n\s*Undergraduate (☑|☐)\s*Masters (☑|☐)\s*PhD (☑|☐)\s*Other (☑|☐)\s*\n\s*Course:\s*([^\n]*)", re.DOTALL)
+
+# Part 3
+_PURPOSE_PROMPT = "What is the purpose of the research?"
+_QUESTIONS_PROMPT = "What question(s) do you hope to answer?"
+_METHODOLOGY_PROMPT = "Describe the data collection methodology"
+_ANALYSIS_PROMPT = "Briefly describe the data analysis processes"
+_RESEARCH_SITES_PROMPT = "Briefly describe the research sites"
+_PART3_FIELDS = [
+    ("Purpose of the research", _PURPOSE_PROMPT, _QUESTIONS_PROMPT, 250, 300),
+    ("Research question(s)", _QUESTIONS_PROMPT, _METHODOLOGY_PROMPT, None, None),
+    ("Data collection methodology", _METHODOLOGY_PROMPT, _ANALYSIS_PROMPT, 250, 300),
+    ("Data analysis processes", _ANALYSIS_PROMPT, _RESEARCH_SITES_PROMPT, 150, 300),
+    ("Research sites", _RESEARCH_SITES_PROMPT, None, None, None)
+]
+# Longer phrases come first so the alternation prefers them; the implied shorter terms are added back after the scan.
+_METHOD_TERMS_RE = re.compile(r"internet survey|online survey|human genetics|survey|genetic|interview|focus group|observation|action research|clinical trial|existing data set|mixed method|biobank|collaborator|external organization|visual stimuli")
+_IMPLIED_METHOD_TERMS = {"internet survey": "survey", "online survey": "survey", "human genetics": "genetic"}
+_QUALITATIVE_TERMS = {"interview", "focus group", "observation", "action research"}
+_QUANTITATIVE_TERMS = {"survey", "clinical trial", "existing data set", "human genetics"}
+# Consent form languages, by research site
+_DEFAULT_LANGUAGES = "English"
+_KAZAKHSTAN_LANGUAGES = "English, Russian, Kazakh"
+_FOREIGN_LANGUAGES = "English, Official language(s) of the country"
+
+# Part 4
+_SPECIAL_POPULATIONS = [
+    ("Minors", "Minors (under 18 years of age)?"),
+    ("Legally incompetent", "Legally incompetent?"),
+    ("Prisoners", "Prisoners?"),
+    ("Perinatal women", "Perinatal women"),
+    ("Institutionalized", "Institutionalized?"),
+    ("Mentally incapacitated", "Mentally incapacitated?"),
+    ("Sexual behaviors", "Sexual behaviors?"),
+    ("Drug use", "Drug use?"),
+    ("Illegal conduct", "Illegal conduct?"),
+    ("Use of alcohol", "Use of alcohol?")
+]
+_OTHER_SPECIAL_RE = re.compile(r"Other \(please specify\)\s*([^\n]*)")
+_SAMPLE_SIZE_RE = re.compile(r"Expected number of participants or sample size:\s*(\d+)")
+_PARTICIPANT_FIELDS = [
+    ("Languages of communication", re.compile(r"Languages of communication:\s*([^\n]+)")),
+    ("Gender, race or ethnic group", re.compile(r"Gender, race or ethnic group.*?:\s*([^\n]+)")),
+    ("Affiliation of participants", re.compile(r"Affiliation of participants.*?:\s*([^\n]+)")),
+    ("Mental health", re.compile(r"Participants’ general state of mental health:\s*([^\n]+)")),
+    ("Physical health", re.compile(r"Participants’ general state of physical health:\s*([^\n]+)"))
+]
+# Free-text answers run from the line after their prompt up to the next prompt
+_JUSTIFICATION_PROMPT = "Explain why you have chosen this particular group"
+_RELATIONSHIP_PROMPT = "What is your relationship to the participants?"
+_POWER_DYNAMICS_PROMPT = "Does your relationship potentially create any power"
+_CONTACT_METHOD_PROMPT = "How will you contact potential participants"
+_RECRUITMENT_METHOD_PROMPT = "Describe the method for recruiting participants"
+_EXCLUSIONS_PROMPT = "Exclusions:"
+_WITHDRAWAL_PROMPT = "Procedures in the event of a participant withdrawing"
+_RECRUITMENT_PROMPT = "Will participants be recruited?"
+
+# Part 5
+_DATA_COLLECTION_DATES_RE = re.compile(r"When is the data collection for the research intended to begin and end\?.*?\n\s*(\d{2}/\d{4})\s*to\s*(\d{2}/\d{4})")
+_INVOLVEMENT_PROMPT = "Describe how subjects will be involved in detail"
+_ADMINISTRATION_PROMPT = "Will you be the one administering"
+_DISCOMFORT_PROMPT = "Will the participants experience any discomfort?"
+_DISCOMFORT_EXPLANATION_PROMPT = "If “Yes”, please explain"
+_DECEPTION_PROMPT = "Will deception or false or misleading information be used"
+_DECEPTION_EXPLANATION_PROMPT = "If “Yes”, explain why deception is necessary"
+
+# Part 6
+_ELECTRONIC_SURVEY_PROMPT = "Are you conducting a survey using any electronic media?"
+_NAME_PRIVACY_PROMPT = "Will you assure that the participant will only see his/her name?"
+_READ_RECEIPT_PROMPT = "Will you have the “read receipt” function turned off?"
+_EMAIL_EXPLANATION_PROMPT = "If you answered “No” to these questions, please explain"
+_DROPDOWN_RE = re.compile(r"Do they have the option to choose “No response”.*?(Yes ☑|No ☑|No dropdown menu ☑|Yes ☐|No ☐|No dropdown menu ☐)")
+_TRANSMISSION_PROMPT = "How will data be transmitted?"
+_URL_PROMPT = "What is the URL?"
+_NO_SURVEY_CHECKBOXES = [
+    ("Name privacy", _NAME_PRIVACY_PROMPT),
+    ("Read receipt", _READ_RECEIPT_PROMPT)
+]
+_NO_SURVEY_DROPDOWN_RE = re.compile(_DROPDOWN_RE.pattern, re.DOTALL)
+_STORAGE_PROMPT = "Where will data be stored?"
+_MAINTENANCE_PROMPT = "How will data be maintained?"
+_SHARING_PROMPT = "Will data be shared?"
+_SHARING_DETAILS_PROMPT = "How? With whom? Will subjects be re-identifiable? Why or why not?"
+_SECURITY_PROMPT = "Describe the data security plan"
+
+# Part 7
+_MINIMAL_RISK_PROMPT = "Do you believe those risks will be no greater than minimal?"
+_MINIMAL_RISK_EXPLANATION_PROMPT = "Explain why:"
+_RISKS_PROMPT = "Describe all risks"
+_RISK_FIELDS = [
+    ("Why risks are essential", "Explain why these risks are essential", "What have you done to minimize risks"),
+    ("Minimize risks", "What have you done to minimize risks", "What protections have you put in place"),
+    ("Protections", "What protections have you put in place", "What procedures have you established"),
+    ("Adverse events reporting", "What procedures have you established for reporting adverse events", "Will the participants directly")
+]
+_PARTICIPANT_BENEFITS_PROMPT = "Will the participants directly or indirectly benefit"
+_BENEFITS_EXPLANATION_PROMPT = "Please explain:"
+_SOCIETAL_BENEFITS_PROMPT = "What are the anticipated benefits to society"
+_INCENTIVES_PROMPT = "Will incentives be offered"
+_INCENTIVES_DETAILS_PROMPT = "If “Yes”, please describe"
+
+# Part 8
+# "interview via video" is covered by "video"
+_RECORDING_TERMS_RE = re.compile(r"video|audio|photograph|recording")
+_RECORDINGS_PROMPT = "Will you be video recording"
+_CONSENT_RECORDINGS_PROMPT = "Will you be obtaining signed consent forms"
+_IDENTIFIABILITY_PROMPT = "Will the data be identifiable"
+_IDENTIFIABILITY_EXPLANATION_PROMPT = "If “Yes”, please explain"
+_ANONYMITY_PROMPT = "Describe procedures to create/preserve anonymity"
+_CONFIDENTIALITY_PROMPT = "Describe procedures to preserve confidentiality"
+# (field name, next prompt); each field name is also its own prompt
+_CONFIDENTIALITY_FIELDS = [
+    ("During data collection", "While results are analyzed"),
+    ("While results are analyzed", "In publication/reporting"),
+    ("In publication/reporting", "In storage after research completion"),
+    ("In storage after research completion", None)
+]
+
+# Part 10
+_FUNDING_PROMPT = "Is this project being supported by any funding sources?"
+_FUNDING_SOURCE_PROMPT = "If yes, please specify the funding source(s):"
+_EXTERNAL_FUNDING_PROMPT = "Is the funding external to Nazarbayev University?"
+
+# Part 11
+# The surname prefix is checked with str.startswith, so only the part after "Surname_" is matched here
+# Alternatives are tried in order, so the application form takes precedence over the generic document form.
+_FILE_NAME_RE = re.compile(
+    r"(?P<application>IREC Application_\d{2}\d{2}\d{4})"
+    r"|(?P<document>(?P<description>.+?-(?P<language>Eng|Ru|Kz))_\d{2}\d{2}\d{4})"
+    r"|(?P<training>(CITI|TRREE)_\d{2}\d{2}\d{4})"
+)
+_CHECKLIST_START_RE = re.compile(r"CHECKLIST\s*Please indicate which forms.*?\n", re.DOTALL)
+# Items can only start at a line start; anchoring there keeps long unchecked lines from being
+# retried at every offset
+_CHECKLIST_ITEM_RE = re.compile(r"^([^\n]+?)\s*(☑|☐)\s*(?:\n|$)", re.MULTILINE)
+
 def count_words(text: str) -> int:
     """Counts words in a given text, ignoring whitespace and punctuation."""
-    words = re.findall(r'\b\w+\b', text)
-    return len(words)
+    # subn counts the matches without building a list of word strings.
+    return _WORD_RE.subn("", text)[1]
 
+# Dates repeat heavily across a batch of applications and the result is an immutable datetime.
+@lru_cache(maxsize=4096)
 def validate_date_format(date_str: str, format_str: str = "%m/%Y") -> Optional[datetime]:
     """Validates if date is in specified format and returns parsed datetime or None."""
     try:
+        # Plain MM/YYYY values are built directly; strptime is comparatively slow.
+        if format_str == "%m/%Y" and len(date_str) == 7 and date_str.isascii() and date_str[2] == "/" and date_str[:2].isdigit() and date_str[3:].isdigit():
+            return datetime(int(date_str[3:]), int(date_str[:2]), 1)
         return datetime.strptime(date_str, format_str)
     except ValueError:
         return None
 
 def validate_email(email: str) -> bool:
     """Validates if email contains '@' and '.'."""
-    return bool(re.match(r".+@.+\..+", email))
+    if "@" not in email or "." not in email:
+        return False
+    return bool(_EMAIL_RE.match(email))
 
 def validate_file_name(file_name: str, pi_surname: str) -> Tuple[bool, str]:
     """
@@ -32,114 +280,270 @@ def validate_file_name(file_name: str, pi_surname: str) -> Tuple[bool, str]:
     - Other: Surname_[Description-Language]_MMDDYYYY
     """
     name_without_ext = file_name.rsplit('.', 1)[0]
-    date_pattern = r"\d{2}\d{2}\d{4}"
-    
-    if re.match(rf"^{pi_surname}_IREC Application_{date_pattern}$", name_without_ext):
+    prefix = f"{pi_surname}_"
+    if not name_without_ext.startswith(prefix):
+        return False, f"File '{file_name}' does not follow naming protocol."
+    match = _FILE_NAME_RE.fullmatch(name_without_ext, len(prefix))
+    if not match:
+        return False, f"File '{file_name}' does not follow naming protocol."
+    
+    if match.lastgroup == "application":
         return True, "Application form naming is valid."
-    
-    pattern = rf"^{pi_surname}_(.+?-(Eng|Ru|Kz))_{date_pattern}$"
-    match = re.match(pattern, name_without_ext)
-    if match:
-        description = match.group(1)
-        language = match.group(2)
+    if match.lastgroup == "document":
+        description = match.group("description")
+        language = match.group("language")
         return True, f"File '{file_name}' naming is valid (Description: {description}, Language: {language})."
+    return True, f"Ethics training certificate naming is valid for '{name_without_ext}'."
+
+def _checkbox_index(text: str, pattern: re.Pattern = _CHECKBOX_RE) -> Tuple[List[int], List[str]]:
+    """Scans the text once and returns the offsets and tokens of all checkboxes (Yes/No by default)."""
+    offsets, tokens = [], []
+    for match in pattern.finditer(text):
+        offsets.append(match.start())
+        tokens.append(match.group())
+    return offsets, tokens
+
+def _checkbox_answer(text: str, index: Tuple[List[int], List[str]], prompt: str, scope: str = "below", pos: int = 0) -> Optional[str]:
+    """
+    Returns the first checkbox answering the prompt (searched from pos), or None if absent.
+    scope is "below" (a line after the prompt's line), "line" (the rest of the prompt's line)
+    or "any" (anywhere after the prompt).
+    """
+    offsets, tokens = index
+    start = text.find(prompt, pos)
+    while start != -1:
+        end = start + len(prompt)
+        line_end = text.find("\n", end)
+        if scope == "below":
+            if line_end == -1:
+                return None
+            end = line_end
+        position = bisect_left(offsets, end)
+        if position == len(tokens):
+            return None
+        if scope != "line" or line_end == -1 or offsets[position] < line_end:
+            return tokens[position]
+        # A later occurrence of the prompt may still carry its answer on the same line
+        start = text.find(prompt, start + 1)
+    return None
+
+def _status_checkbox(line: str) -> Optional[str]:
+    """
+    Returns the marked Yes/No checkbox on a line, or its first checkbox if none is marked.
+    Neither the first nor the last box alone is reliable: 'Yes ☑ No ☐' and 'Yes ☐ No ☑' need different ends.
+    """
+    boxes = _CHECKBOX_RE.findall(line)
+    if not boxes:
+        return None
+    return next((box for box in boxes if box.endswith("☑")), boxes[0])
+
+def _parse_blocks(text: str, header: str, end_markers: Tuple[str, ...], header_anywhere: bool = False) -> List[Dict[str, str]]:
+    """
+    Parses the blocks opened by a header line (e.g. 'Principal Investigator') in a single pass.
+    Each block maps 'Label: value' lines to their values and keeps the Yes/No answer (see _status_checkbox)
+    on or after the CITI course question under "CITI status"; 'Label: value' lines before the answer are
+    still parsed. "Name" is only read from the first non-blank line of a block, as the form places it
+    directly under the header. A block ends at the next header or end marker.
+    The header must end its line unless header_anywhere is set, in which case trailing text is allowed.
+    """
+    blocks = []
+    current = None
+    awaiting_status = False
+    leading = False
+    for line in text.split("\n"):
+        if (header in line) if header_anywhere else line.rstrip().endswith(header):
+            current = {}
+            blocks.append(current)
+            awaiting_status = False
+            leading = True
+            continue
+        if current is None or not line.strip():
+            continue
+        if any(marker in line for marker in end_markers):
+            current = None
+            continue
+        first_line, leading = leading, False
+        if awaiting_status:
+            status = _status_checkbox(line)
+            if status:
+                current["CITI status"] = status
+                awaiting_status = False
+                continue
+        elif "CITI status" not in current and line.lstrip().startswith(_CITI_STATUS_PROMPT):
+            # The boxes may share the question's line; otherwise they follow on a later one
+            status = _status_checkbox(line)
+            if status:
+                current["CITI status"] = status
+            else:
+                awaiting_status = True
+            continue
+        label, colon, value = line.partition(":")
+        label = label.lstrip()
+        if colon and label and label not in current and (first_line or label != "Name"):
+            current[label] = value.strip()
     
-    training_pattern = rf"^{pi_surname}_(CITI|TRREE)_{date_pattern}$"
-    if re.match(training_pattern, name_without_ext):
-        return True, f"Ethics training certificate naming is valid for '{name_without_ext}'."
-    
-    return False, f"File '{file_name}' does not follow naming protocol."
+    return blocks
 
-def validate_part_0(doc: docx.Document) -> Tuple[Dict[str, List[str]], bool]:
-    """Validates Part 0: Do I Submit an NU IREC Application?"""
+def _method_terms(methodology: str) -> Set[str]:
+    """Returns the methodology keywords found in the lowercased text, using one regex scan."""
+    terms = set(_METHOD_TERMS_RE.findall(methodology))
+    terms.update([_IMPLIED_METHOD_TERMS[term] for term in terms if term in _IMPLIED_METHOD_TERMS])
+    return terms
+
+def split_sections(doc: "docx.Document") -> Dict[str, str]:
+    """
+    Splits the document into part texts in a single pass over its paragraphs.
+    Each section runs from the first paragraph containing its header through the first
+    paragraph containing the next header (inclusive); a missing section maps to "".
+    """
+    texts = [para.text for para in doc.paragraphs]
+    first_seen = {}
+    for index, text in enumerate(texts):
+        if "Part " not in text:
+            continue
+        for match in _SECTION_MARKER_RE.finditer(text):
+            first_seen.setdefault(match.group(), index)
+    
+    sections = {}
+    last = len(texts) - 1
+    for key, start_marker, end_marker, _ in _SECTIONS:
+        start = first_seen.get(start_marker)
+        end = first_seen.get(end_marker, last) if end_marker else last
+        if start is None or start > end:
+            sections[key] = ""
+        else:
+            sections[key] = "\n".join(texts[start:end + 1]) + "\n"
+    return sections
+
+def _match_text(match: Optional[re.Match]) -> str:
+    """Returns the stripped first group of a match, or "" if there was no match."""
+    return match.group(1).strip() if match else ""
+
+def _text_after(text: str, prompt: str) -> str:
+    """Returns the stripped text following the prompt through the end, or "" if the prompt is missing."""
+    start = text.find(prompt)
+    return text[start + len(prompt):].strip() if start != -1 else ""
+
+def _field_span(text: str, prompt: str, next_prompt: Optional[str], pos: int = 0) -> Tuple[str, int]:
+    """
+    Returns the answer to a free-text prompt searched from pos, with the offset just past the prompt.
+    A missing prompt yields "" and leaves the offset at pos so a sweep over consecutive prompts can continue.
+    """
+    start = text.find(prompt, pos)
+    if start == -1:
+        return "", pos
+    pos = start + len(prompt)
+    start = text.find("\n", pos)
+    if start == -1:
+        return "", pos
+    end = text.find(next_prompt, start + 1) if next_prompt else -1
+    return (text[start + 1:] if end == -1 else text[start + 1:end]).strip(), pos
+
+def _field_text(text: str, prompt: str, next_prompt: Optional[str]) -> str:
+    """
+    Returns the stripped answer to a free-text prompt: the text from the line after the prompt
+    up to the next occurrence of next_prompt (or the end), or "" if the prompt is missing.
+    """
+    return _field_span(text, prompt, next_prompt)[0]
+
+def _line_after(text: str, prompt: str) -> str:
+    """Returns the stripped first non-blank line after the prompt's line, or "" if the prompt is missing."""
+    start = text.find(prompt)
+    if start == -1:
+        return ""
+    start = text.find("\n", start + len(prompt))
+    if start == -1:
+        return ""
+    end = text.find("\n", start + 1)
+    while end != -1 and not text[start + 1:end].strip():
+        start, end = end, text.find("\n", end + 1)
+    return (text[start + 1:] if end == -1 else text[start + 1:end]).strip()
+
+def _section_body(text: str, next_header: str) -> str:
+    """Returns the section text without the next part's header, which split_sections keeps as its last paragraph."""
+    end = text.rfind(next_header)
+    return text if end == -1 else text[:end]
+
+def _open_section(sections: Dict[str, str], key: str) -> Tuple[Dict[str, List[str]], str]:
+    """Returns a fresh results dict and the section text, recording an error if the section is missing."""
     results = {"errors": [], "warnings": [], "info": []}
-    part_0_text = ""
-    in_part_0 = False
-    
-    for para in doc.paragraphs:
-        if "Part 0: Do I Submit an NU IREC Application?" in para.text:
-            in_part_0 = True
-        if in_part_0:
-            part_0_text += para.text + "\n"
-        if "Part 1: Cover Sheet" in para.text:
-            break
+    text = sections[key]
+    if not text:
+        results["errors"].append(_MISSING_SECTION_MESSAGES[key])
+    return results, text
+
+def _explanation(text: str, na_index: Tuple[List[int], List[str]], prompt: str, next_prompt: Optional[str]) -> Tuple[Optional[str], str]:
+    """Returns the N/A checkbox and the free text answering an explanation prompt, locating the prompt once."""
+    start = text.find(prompt)
+    if start == -1:
+        return None, ""
+    return _checkbox_answer(text, na_index, prompt, pos=start), _field_span(text, prompt, next_prompt, start)[0]
+
+def _check_explained_answer(results: Dict[str, List[str]], label: str, answer: Optional[str], explanation: str, na: Optional[str] = None, noun: str = "explanation") -> bool:
+    """
+    Records a Yes/No question whose explanation is required for Yes and should be empty for No.
+    Returns True if Yes is marked, so the caller can add the forms it requires.
+    """
+    if not answer:
+        results["errors"].append(f"{label} question not found or improperly formatted.")
+        return False
+    if answer.endswith("☐"):
+        results["warnings"].append(f"{label} checkbox is not marked (☐).")
+        return False
+    if answer == "Yes ☑":
+        results["info"].append(f"{label}: Yes.")
+        if na == "N/A ☑":
+            results["errors"].append(f"{label} {noun} cannot be N/A when {label.lower()} is Yes.")
+        elif not explanation:
+            results["errors"].append(f"{label} {noun} is missing or empty.")
+        else:
+            results["info"].append(f"{label} {noun} provided.")
+        return True
+    results["info"].append(f"{label}: No.")
+    if explanation:
+        results["warnings"].append(f"{label} {noun} provided when {label.lower()} is No.")
+    return False
+
+def validate_part_0(sections: Dict[str, str]) -> Tuple[Dict[str, List[str]], bool]:
+    """Validates Part 0: Do I Submit an NU IREC Application?"""
+    results, part_0_text = _open_section(sections, "Part 0")
     
     if not part_0_text:
-        results["errors"].append("Part 0 section not found.")
         return results, False
     
-    questions = [
-        {
-            "text": "Does your research involve human subjects?",
-            "pattern": r"Does your research involve human subjects.*?\n.*?(Yes ☑|No ☑|Yes ☐|No ☐)",
-            "application_needed": lambda answer: answer.startswith("Yes")
-        },
-        {
-            "text": "Is this project being conducted solely to fulfill course requirements?",
-            "pattern": r"Is this project being conducted solely to fulfill course requirements.*?\n.*?(Yes ☑|No ☑|Yes ☐|No ☐)",
-            "application_needed": lambda answer: answer.startswith("No")
-        },
-        {
-            "text": "Is this project a quality assurance activity?",
-            "pattern": r"Is this project a quality assurance activity.*?\n.*?(Yes ☑|No ☑|Yes ☐|No ☐)",
-            "application_needed": lambda answer: answer.startswith("No")
-        },
-        {
-            "text": "Would you like to use this study to launch future investigations?",
-            "pattern": r"Would you like to use this study to launch future investigations.*?\n.*?(Yes ☑|No ☑|Yes ☐|No ☐)",
-            "application_needed": lambda answer: answer.startswith("Yes")
-        },
-        {
-            "text": "Would you like to disseminate or publish findings?",
-            "pattern": r"Would you like to disseminate or publish findings.*?\n.*?(Yes ☑|No ☑|Yes ☐|No ☐)",
-            "application_needed": lambda answer: answer.startswith("Yes")
-        },
-        {
-            "text": "Do you think this research is eligible for an Exemption?",
-            "pattern": r"Do you think this research is eligible for an Exemption.*?\n.*?(Yes ☑|No ☑|Yes ☐|No ☐)",
-            "application_needed": lambda answer: True
-        }
-    ]
-    
     application_needed = False
     exemption_claimed = False
-    for question in questions:
-        match = re.search(question["pattern"], part_0_text, re.DOTALL)
-        if not match:
-            results["errors"].append(f"Response to '{question['text']}' not found or improperly formatted.")
+    checkboxes = _checkbox_index(part_0_text)
+    for question_text, prompt, needs_application in _PART0_QUESTIONS:
+        answer = _checkbox_answer(part_0_text, checkboxes, prompt)
+        if not answer:
+            results["errors"].append(f"Response to '{question_text}' not found or improperly formatted.")
             continue
         
-        answer = match.group(1)
-        if "☐" in answer:
-            results["warnings"].append(f"Checkbox for '{question['text']}' is not marked (☐).")
+        if answer.endswith("☐"):
+            results["warnings"].append(f"Checkbox for '{question_text}' is not marked (☐).")
             continue
         
-        if question["application_needed"](answer):
+        if needs_application(answer):
             application_needed = True
         
-        if question["text"] == "Do you think this research is eligible for an Exemption?" and answer == "Yes ☑":
+        if question_text == "Do you think this research is eligible for an Exemption?" and answer == "Yes ☑":
             exemption_claimed = True
         
-        results["info"].append(f"Response to '{question['text']}': {answer}")
+        results["info"].append(f"Response to '{question_text}': {answer}")
     
     if not application_needed:
         results["errors"].append("Part 0 responses indicate no application is needed.")
     
     if exemption_claimed:
-        justification = re.search(r"Outline the reasons why your study should be considered exempt:(.*?)(Part 1:|$)", part_0_text, re.DOTALL)
-        if justification and justification.group(1).strip():
+        justification = _text_after(_section_body(part_0_text, "Part 1:"), _EXEMPTION_JUSTIFICATION_PROMPT)
+        if justification:
             results["info"].append("Exemption justification provided.")
         else:
             results["warnings"].append("Exemption claimed, but no justification provided.")
     
-    exemption_categories = [
-        ("f1", r"f1 (☑|☐) Research conducted in established or commonly accepted educational settings"),
-        ("f2", r"f2 (☑|☐) Research involving the use of educational tests"),
-        ("f3", r"f3 (☑|☐) Research involving the collection or study of existing data")
-    ]
-    
-    for category_name, pattern in exemption_categories:
-        match = re.search(pattern, part_0_text, re.DOTALL)
+    for category_name, pattern in _EXEMPTION_CATS:
+        match = pattern.search(part_0_text)
         if not match:
             results["errors"].append(f"Exemption category '{category_name}' not found.")
             continue
@@ -150,61 +554,35 @@ def validate_part_0(doc: docx.Document) -> Tuple[Dict[str, List[str]], bool]:
     
     return results, exemption_claimed
 
-def validate_part_1(doc: docx.Document, exemption_claimed: bool) -> Dict[str, List[str]]:
+def validate_part_1(sections: Dict[str, str], exemption_claimed: bool) -> Dict[str, List[str]]:
     """Validates Part 1: Cover Sheet."""
-    results = {"errors": [], "warnings": [], "info": []}
-    part_1_text = ""
-    in_part_1 = False
-    
-    for para in doc.paragraphs:
-        if "Part 1: Cover Sheet" in para.text:
-            in_part_1 = True
-        if in_part_1:
-            part_1_text += para.text + "\n"
-        if "Part 2: Research Team Details" in para.text:
-            break
+    results, part_1_text = _open_section(sections, "Part 1")
     
     if not part_1_text:
-        results["errors"].append("Part 1: Cover Sheet section not found.")
         return results
     
-    fields = [
-        ("Principal Investigator:", r"Principal Investigator:\s*([^\n]+)"),
-        ("Application Date:", r"Application Date:\s*([^\n]+)"),
-        ("Nazarbayev University Unit \(School\):", r"Nazarbayev University Unit \(School\):\s*([^\n]+)"),
-        ("Primary Research Discipline:", r"Primary Research Discipline:\s*([^\n]+)"),
-        ("Application Title:", r"Application Title:\s*([^\n]+)")
-    ]
-    
-    for field_name, pattern in fields:
-        match = re.search(pattern, part_1_text)
-        if not match or not match.group(1).strip():
+    for field_name, pattern in _PART1_FIELDS:
+        value = _match_text(pattern.search(part_1_text))
+        if not value:
             results["errors"].append(f"Field '{field_name}' is missing or empty.")
         else:
-            value = match.group(1).strip()
             results["info"].append(f"Field '{field_name}' filled: {value}")
             if field_name == "Application Date:":
                 try:
-                    datetime.strptime(value, "%m/%d/%Y")
+                    datetime.strptime(value, _MDY_FORMAT)
                     results["info"].append("Application Date is in valid format (MM/DD/YYYY).")
                 except ValueError:
                     results["errors"].append("Application Date is not in valid format (MM/DD/YYYY).")
     
-    review_types = [
-        ("An Expedited Review", r"An Expedited Review\s+.*?(Yes ☑|No ☑|Yes ☐|No ☐)"),
-        ("A Full Board Review", r"A Full Board Review\s+.*?(Yes ☑|No ☑|Yes ☐|No ☐)"),
-        ("An Exemption", r"An Exemption\s+.*?(Yes ☑|No ☑|Yes ☐|No ☐)")
-    ]
-    
     selected_reviews = []
-    for review_name, pattern in review_types:
-        match = re.search(pattern, part_1_text, re.DOTALL)
-        if not match:
+    checkboxes = _checkbox_index(part_1_text)
+    for review_name in _REVIEW_TYPES:
+        answer = _checkbox_answer(part_1_text, checkboxes, review_name, "any")
+        if not answer:
             results["errors"].append(f"Response to '{review_name}' not found or improperly formatted.")
             continue
         
-        answer = match.group(1)
-        if "☐" in answer:
+        if answer.endswith("☐"):
             results["warnings"].append(f"Checkbox for '{review_name}' is not marked (☐).")
         elif answer == "Yes ☑":
             selected_reviews.append(review_name)
@@ -220,165 +598,83 @@ def validate_part_1(doc: docx.Document, exemption_claimed: bool) -> Dict[str, Li
     
     return results
 
-def validate_part_2(doc: docx.Document) -> Tuple[Dict[str, List[str]], str]:
+def _check_citi_date(results: Dict[str, List[str]], value: str, cutoff: datetime, subject: str) -> None:
+    """Records whether a MM/DD/YYYY training date is valid and no older than the cutoff."""
+    try:
+        citi_date = datetime.strptime(value, _MDY_FORMAT)
+    except ValueError:
+        results["errors"].append(f"{subject} date is not in valid format (MM/DD/YYYY).")
+        return
+    if citi_date < cutoff:
+        results["errors"].append(f"{subject} date is older than 3 years.")
+    else:
+        results["info"].append(f"{subject} date is valid.")
+
+def _check_citi_status(results: Dict[str, List[str]], status: Optional[str], subject: str) -> None:
+    """Records the Yes/No CITI course checkbox of one team member."""
+    if not status:
+        results["errors"].append(f"{subject} not found.")
+    elif status == "No ☑":
+        results["errors"].append(f"{subject} is 'No'.")
+    elif status in ["Yes ☐", "No ☐"]:
+        results["warnings"].append(f"{subject} checkbox is not marked (☐).")
+    else:
+        results["info"].append(f"{subject} is 'Yes'.")
+
+def _validate_person(results: Dict[str, List[str]], person: Dict[str, str], fields: List[Tuple[str, str, bool, bool]], cutoff: datetime, prefix: str, citi_subject: str, status_subject: str) -> None:
+    """Checks one team member's parsed block against its field specs, then their CITI course status."""
+    for field_name, label, is_email, is_citi_date in fields:
+        value = person.get(label, "")
+        if not value:
+            results["errors"].append(f"{prefix}Field '{field_name}' is missing or empty.")
+            continue
+        results["info"].append(f"{prefix}Field '{field_name}' filled: {value}")
+        if is_email and not validate_email(value):
+            results["errors"].append(f"{prefix}Invalid email format for '{field_name}': {value}")
+        if is_citi_date:
+            _check_citi_date(results, value, cutoff, citi_subject)
+    
+    _check_citi_status(results, person.get("CITI status"), status_subject)
+
+def validate_part_2(sections: Dict[str, str]) -> Tuple[Dict[str, List[str]], str]:
     """Validates Part 2: Research Team Details and extracts PI surname."""
-    results = {"errors": [], "warnings": [], "info": []}
-    part_2_text = ""
-    in_part_2 = False
+    results, part_2_text = _open_section(sections, "Part 2")
     pi_surname = ""
-    
-    for para in doc.paragraphs:
-        if "Part 2: Research Team Details" in para.text:
-            in_part_2 = True
-        if in_part_2:
-            part_2_text += para.text + "\n"
-        if "Part 3: Research Design" in para.text:
-            break
+    three_years_ago = datetime.now() - _CITI_VALIDITY
     
     if not part_2_text:
-        results["errors"].append("Part 2: Research Team Details section not found.")
         return results, pi_surname
     
-    pi_name_match = re.search(r"Principal Investigator\s*\n\s*Name:\s*([^\n]+)", part_2_text, re.DOTALL)
-    if pi_name_match and pi_name_match.group(1).strip():
-        pi_name = pi_name_match.group(1).strip()
+    pi_block = next(iter(_parse_blocks(part_2_text, _PI_HEADER, (_RA_HEADER, _AI_HEADER, _STUDENTS_HEADER))), {})
+    ra_block = next(iter(_parse_blocks(part_2_text, _RA_HEADER, (_AI_HEADER, _STUDENTS_HEADER))), {})
+    
+    pi_name = pi_block.get("Name", "")
+    if pi_name:
         pi_surname = pi_name.split()[-1]  # Assume last word is surname
         results["info"].append(f"PI Name: {pi_name}, Surname extracted: {pi_surname}")
     
-    pi_fields = [
-        ("PI Name:", r"Principal Investigator\s*\n\s*Name:\s*([^\n]+)"),
-        ("PI NU ID:", r"Principal Investigator\s*\n.*?\n\s*NU ID:\s*([^\n]+)"),
-        ("PI NU School:", r"Principal Investigator\s*\n.*?\n\s*NU School:\s*([^\n]+)"),
-        ("PI Department:", r"Principal Investigator\s*\n.*?\n\s*Department:\s*([^\n]+)"),
-        ("PI Position:", r"Principal Investigator\s*\n.*?\n\s*Position:\s*([^\n]+)"),
-        ("PI E-mail address:", r"Principal Investigator\s*\n.*?\n\s*E-mail address:\s*([^\n]+)"),
-        ("PI Daytime Phone:", r"Principal Investigator\s*\n.*?\n\s*Daytime Phone:\s*([^\n]+)"),
-        ("PI Mobile phone:", r"Principal Investigator\s*\n.*?\n\s*Mobile phone:\s*([^\n]+)"),
-        ("PI CITI Training completion date:", r"Principal Investigator\s*\n.*?\n\s*CITI Training completion date:\s*([^\n]+)")
-    ]
+    _validate_person(results, pi_block, _PI_FIELDS, three_years_ago, "", "PI CITI Training", "PI CITI training status")
+    _validate_person(results, ra_block, _RA_FIELDS, three_years_ago, "", "RA CITI training", "RA CITI training status")
     
-    for field_name, pattern in pi_fields:
-        match = re.search(pattern, part_2_text, re.DOTALL)
-        if not match or not match.group(1).strip():
-            results["errors"].append(f"Field '{field_name}' is missing or empty.")
-        else:
-            value = match.group(1).strip()
-            results["info"].append(f"Field '{field_name}' filled: {value}")
-            if field_name == "PI E-mail address:" and not validate_email(value):
-                results["errors"].append(f"Invalid email format for '{field_name}': {value}")
-            if field_name == "PI CITI Training completion date:":
-                try:
-                    citi_date = datetime.strptime(value, "%m/%d/%Y")
-                    three_years_ago = datetime.now() - timedelta(days=3*365)
-                    if citi_date < three_years_ago:
-                        results["errors"].append("PI CITI Training date is older than 3 years.")
-                    else:
-                        results["info"].append("PI CITI Training date is valid.")
-                except ValueError:
-                    results["errors"].append("PI CITI Training date is not in valid format (MM/DD/YYYY).")
-    
-    pi_citi_status = re.search(r"Principal Investigator\s*\n.*?\n\s*Have you completed the CITI basic course.*?\n.*?(Yes ☑|No ☑|Yes ☐|No ☐)", part_2_text, re.DOTALL)
-    if not pi_citi_status:
-        results["errors"].append("PI CITI training status not found.")
-    elif pi_citi_status.group(1) == "No ☑":
-        results["errors"].append("PI CITI training status is 'No'.")
-    elif pi_citi_status.group(1) in ["Yes ☐", "No ☐"]:
-        results["warnings"].append("PI CITI training status checkbox is not marked (☐).")
-    else:
-        results["info"].append("PI CITI training status is 'Yes'.")
-    
-    ra_fields = [
-        ("RA Name:", r"Research Advisor:\s*\n\s*Name:\s*([^\n]+)"),
-        ("RA NU ID:", r"Research Advisor:\s*\n.*?\n\s*NU ID:\s*([^\n]+)"),
-        ("RA NU School:", r"Research Advisor:\s*\n.*?\n\s*NU School:\s*([^\n]+)"),
-        ("RA Department:", r"Research Advisor:\s*\n.*?\n\s*Department:\s*([^\n]+)"),
-        ("RA Position:", r"Research Advisor:\s*\n.*?\n\s*Position:\s*([^\n]+)"),
-        ("RA E-mail address:", r"Research Advisor:\s*\n.*?\n\s*E-mail address:\s*([^\n]+)"),
-        ("RA CITI or alternative training completion date:", r"Research Advisor:\s*\n.*?\n\s*CITI or alternative training completion date:\s*([^\n]+)")
+    additional_investigators = [
+        block for block in _parse_blocks(part_2_text, _AI_HEADER, (_STUDENTS_HEADER,), header_anywhere=True)
+        if "CITI status" in block and all(label in block for _, label, _, _ in _AI_FIELDS)
     ]
     
-    for field_name, pattern in ra_fields:
-        match = re.search(pattern, part_2_text, re.DOTALL)
-        if not match or not match.group(1).strip():
-            results["errors"].append(f"Field '{field_name}' is missing or empty.")
-        else:
-            value = match.group(1).strip()
-            results["info"].append(f"Field '{field_name}' filled: {value}")
-            if field_name == "RA E-mail address:" and not validate_email(value):
-                results["errors"].append(f"Invalid email format for '{field_name}': {value}")
-            if field_name == "RA CITI or alternative training completion date:":
-                try:
-                    citi_date = datetime.strptime(value, "%m/%d/%Y")
-                    three_years_ago = datetime.now() - timedelta(days=3*365)
-                    if citi_date < three_years_ago:
-                        results["errors"].append("RA CITI training date is older than 3 years.")
-                    else:
-                        results["info"].append("RA CITI training date is valid.")
-                except ValueError:
-                    results["errors"].append("RA CITI training date is not in valid format (MM/DD/YYYY).")
-    
-    ra_citi_status = re.search(r"Research Advisor:\s*\n.*?\n\s*Have you completed the CITI basic course.*?\n.*?(Yes ☑|No ☑|Yes ☐|No ☐)", part_2_text, re.DOTALL)
-    if not ra_citi_status:
-        results["errors"].append("RA CITI training status not found.")
-    elif ra_citi_status.group(1) == "No ☑":
-        results["errors"].append("RA CITI training status is 'No'.")
-    elif ra_citi_status.group(1) in ["Yes ☐", "No ☐"]:
-        results["warnings"].append("RA CITI training status checkbox is not marked (☐).")
-    else:
-        results["info"].append("RA CITI training status is 'Yes'.")
-    
-    additional_investigator_pattern = r"Additional Investigator\(s\):.*?\n\s*Name:\s*([^\n]*)\n\s*NU ID:\s*([^\n]*)\n\s*NU School:\s*([^\n]*)\n\s*Department:\s*([^\n]*)\n\s*Position:\s*([^\n]*)\n\s*E-mail address:\s*([^\n]*)\n\s*Have you completed the CITI basic course.*?\n.*?(Yes ☑|No ☑|Yes ☐|No ☐)\n\s*.*?\n\s*CITI or alternative training completion date:\s*([^\n]*)"
-    additional_investigators = re.finditer(additional_investigator_pattern, part_2_text, re.DOTALL)
-    
-    investigator_count = 0
-    for match in additional_investigators:
-        investigator_count += 1
-        name = match.group(1).strip()
-        if name:
-            fields = [
-                ("AI Name", name),
-                ("AI NU ID", match.group(2).strip()),
-                ("AI NU School", match.group(3).strip()),
-                ("AI Department", match.group(4).strip()),
-                ("AI Position", match.group(5).strip()),
-                ("AI E-mail address", match.group(6).strip()),
-                ("AI CITI or alternative training completion date", match.group(8).strip())
-            ]
-            
-            for field_name, value in fields:
-                if not value:
-                    results["errors"].append(f"Additional Investigator {investigator_count}: Field '{field_name}' is missing or empty.")
-                else:
-                    results["info"].append(f"Additional Investigator {investigator_count}: Field '{field_name}' filled: {value}")
-                    if field_name == "AI E-mail address:" and not validate_email(value):
-                        results["errors"].append(f"Additional Investigator {investigator_count}: Invalid email format for '{field_name}': {value}")
-                    if field_name == "AI CITI or alternative training completion date":
-                        try:
-                            citi_date = datetime.strptime(value, "%m/%d/%Y")
-                            three_years_ago = datetime.now() - timedelta(days=3*365)
-                            if citi_date < three_years_ago:
-                                results["errors"].append(f"Additional Investigator {investigator_count}: CITI training date is older than 3 years.")
-                            else:
-                                results["info"].append(f"Additional Investigator {investigator_count}: CITI training date is valid.")
-                        except ValueError:
-                            results["errors"].append(f"Additional Investigator {investigator_count}: CITI training date is not in valid format (MM/DD/YYYY).")
-            
-            citi_status = match.group(7)
-            if citi_status == "No ☑":
-                results["errors"].append(f"Additional Investigator {investigator_count}: CITI training status is 'No'.")
-            elif citi_status in ["Yes ☐", "No ☐"]:
-                results["warnings"].append(f"Additional Investigator {investigator_count}: CITI training status checkbox is not marked (☐).")
-            else:
-                results["info"].append(f"Additional Investigator {investigator_count}: CITI training status is 'Yes'.")
+    for investigator_count, investigator in enumerate(additional_investigators, 1):
+        if investigator["Name"]:
+            prefix = f"Additional Investigator {investigator_count}: "
+            _validate_person(results, investigator, _AI_FIELDS, three_years_ago, prefix, f"{prefix}CITI training", f"{prefix}CITI training status")
     
-    if investigator_count == 0:
+    if not additional_investigators:
         results["info"].append("No Additional Investigators specified.")
     
-    student_section = re.search(r"For students:\s*\n\s*Undergraduate (☑|☐)\s*Masters (☑|☐)\s*PhD (☑|☐)\s*Other (☑|☐)\s*\n\s*Course:\s*([^\n]*)", part_2_text, re.DOTALL)
+    student_section = _STUDENT_SECTION_RE.search(part_2_text)
     if not student_section:
         results["errors"].append("For students section not found or improperly formatted.")
     else:
         undergraduate, masters, phd, other, course = student_section.groups()
+        course = course.strip()
         selected_categories = [cat for cat, checked in [
             ("Undergraduate", undergraduate),
             ("Masters", masters),
@@ -391,53 +687,39 @@ def validate_part_2(doc: docx.Document) -> Tuple[Dict[str, List[str]], str]:
         else:
             results["info"].append(f"Student category selected: {selected_categories[0]}.")
         
-        if not course.strip():
+        if not course:
             results["errors"].append("Course field in For students section is missing or empty.")
         else:
-            results["info"].append(f"Course field filled: {course.strip()}.")
+            results["info"].append(f"Course field filled: {course}.")
     
     return results, pi_surname
 
-def validate_part_3(doc: docx.Document) -> Tuple[Dict[str, List[str]], List[Dict], str]:
+def validate_part_3(sections: Dict[str, str]) -> Tuple[Dict[str, List[str]], Dict[str, str], str]:
     """Validates Part 3: Research Design and collects methodology text."""
-    results = {"errors": [], "warnings": [], "info": []}
-    required_forms = [
-        {"form": "Appendix A: IREC Application Form", "reason": "Required for all submissions."},
-        {"form": "CITI Training Certificates", "reason": "Required for all team members."}
-    ]
-    part_3_text = ""
-    in_part_3 = False
-    
-    for para in doc.paragraphs:
-        if "Part 3: Research Design" in para.text:
-            in_part_3 = True
-        if in_part_3:
-            part_3_text += para.text + "\n"
-        if "Part 4: Participants" in para.text:
-            break
+    results, part_3_text = _open_section(sections, "Part 3")
+    required_forms = {
+        "Appendix A: IREC Application Form": "Required for all submissions.",
+        "CITI Training Certificates": "Required for all team members."
+    }
     
     if not part_3_text:
-        results["errors"].append("Part 3: Research Design section not found.")
         return results, required_forms, ""
     
-    fields = [
-        ("Purpose of the research", r"What is the purpose of the research\?.*?\n(.*?)(What question\(s\) do you hope to answer\?|$)", 250, 300),
-        ("Research question(s)", r"What question\(s\) do you hope to answer\?.*?\n(.*?)(Describe the data collection methodology|$)", None, None),
-        ("Data collection methodology", r"Describe the data collection methodology.*?\n(.*?)(Briefly describe the data analysis processes|$)", 250, 300),
-        ("Data analysis processes", r"Briefly describe the data analysis processes.*?\n(.*?)(Briefly describe the research sites|$)", 150, 300),
-        ("Research sites", r"Briefly describe the research sites.*?\n(.*?)(Part 4:|$)", None, None)
-    ]
-    
+    part_3_body = _section_body(part_3_text, "Part 4:")
     methodology_text = ""
-    for field_name, pattern, min_words, max_words in fields:
-        match = re.search(pattern, part_3_text, re.DOTALL)
-        if not match or not match.group(1).strip():
+    research_sites_text = ""
+    # The prompts appear in form order, so each one is searched from just past the previous one.
+    pos = 0
+    for field_name, prompt, next_prompt, min_words, max_words in _PART3_FIELDS:
+        value, pos = _field_span(part_3_body, prompt, next_prompt, pos)
+        if not value:
             results["errors"].append(f"Field '{field_name}' is missing or empty.")
         else:
-            value = match.group(1).strip()
             results["info"].append(f"Field '{field_name}' filled.")
             if field_name == "Data collection methodology":
                 methodology_text = value
+            elif field_name == "Research sites":
+                research_sites_text = value.lower()
             if min_words and max_words:
                 word_count = count_words(value)
                 if word_count < min_words or word_count > max_words:
@@ -445,242 +727,189 @@ def validate_part_3(doc: docx.Document) -> Tuple[Dict[str, List[str]], List[Dict
                 else:
                     results["info"].append(f"Field '{field_name}' word count is valid: {word_count}.")
     
-    methodology = methodology_text.lower()
-    research_sites = re.search(r"Briefly describe the research sites.*?\n(.*?)(Part 4:|$)", part_3_text, re.DOTALL)
-    research_sites_text = research_sites.group(1).lower() if research_sites and research_sites.group(1).strip() else ""
-    languages = ["English"]
+    terms = _method_terms(methodology_text.lower())
     if "kazakhstan" in research_sites_text:
-        languages.extend(["Russian", "Kazakh"])
+        lang_str = _KAZAKHSTAN_LANGUAGES
     elif research_sites_text and "nazarbayev university" not in research_sites_text:
-        languages.append("Official language(s) of the country")
-    
-    if any(term in methodology for term in ["interview", "focus group", "observation", "action research"]):
-        required_forms.extend([
-            {"form": "Appendix B: Written Informed Consent Form", "reason": f"Required for qualitative research in {', '.join(languages)}."},
-            {"form": "Appendix D: Oral Consent Script", "reason": f"Required if oral consent is used in {', '.join(languages)}."},
-            {"form": "Interview Questions/Focus Group Guides", "reason": "Required for qualitative methods."},
-            {"form": "Recruitment Materials (e.g., emails, flyers)", "reason": "Required for participant notification."}
-        ])
-    
-    if any(term in methodology for term in ["survey", "clinical trial", "existing data set", "human genetics"]):
-        if "internet survey" in methodology or "online survey" in methodology:
-            required_forms.append({"form": "Appendix C: Informed Consent Form for Internet Surveys", "reason": f"Required for internet surveys in {', '.join(languages)}."})
+        lang_str = _FOREIGN_LANGUAGES
+    else:
+        lang_str = _DEFAULT_LANGUAGES
+    
+    if terms & _QUALITATIVE_TERMS:
+        required_forms.setdefault("Appendix B: Written Informed Consent Form", f"Required for qualitative research in {lang_str}.")
+        required_forms.setdefault("Appendix D: Oral Consent Script", f"Required if oral consent is used in {lang_str}.")
+        required_forms.setdefault("Interview Questions/Focus Group Guides", "Required for qualitative methods.")
+        required_forms.setdefault("Recruitment Materials (e.g., emails, flyers)", "Required for participant notification.")
+    
+    if terms & _QUANTITATIVE_TERMS:
+        if "internet survey" in terms or "online survey" in terms:
+            required_forms.setdefault("Appendix C: Informed Consent Form for Internet Surveys", f"Required for internet surveys in {lang_str}.")
         else:
-            required_forms.append({"form": "Appendix B: Written Informed Consent Form", "reason": f"Required for quantitative research in {', '.join(languages)}."})
-        required_forms.append({"form": "Surveys/Questionnaires", "reason": "Required for quantitative methods."})
-    
-    if "mixed method" in methodology:
-        required_forms.extend([
-            {"form": "Appendix B: Written Informed Consent Form", "reason": f"Required for mixed methods in {', '.join(languages)}."},
-            {"form": "Recruitment Materials (e.g., emails, flyers)", "reason": "Required for participant notification."}
-        ])
-        if "interview" in methodology or "focus group" in methodology:
-            required_forms.extend([
-                {"form": "Appendix D: Oral Consent Script", "reason": f"Required if oral consent is used in {', '.join(languages)}."},
-                {"form": "Interview Questions/Focus Group Guides", "reason": "Required for qualitative components."}
-            ])
-        if "survey" in methodology:
-            required_forms.append({"form": "Surveys/Questionnaires", "reason": "Required for quantitative components."})
-    
-    if "genetic" in methodology or "biobank" in methodology:
-        required_forms.append({"form": "Appendix M: Written Informed Consent Form For Genetic and/or Biobank Research", "reason": f"Required for genetic/biobank research in {', '.join(languages)}."})
-    
-    if "collaborator" in methodology or "external organization" in methodology:
-        required_forms.append({"form": "Appendix L: Confidentiality Agreement Form", "reason": f"Required for external collaborators in {', '.join(languages)}."})
+            required_forms.setdefault("Appendix B: Written Informed Consent Form", f"Required for quantitative research in {lang_str}.")
+        required_forms.setdefault("Surveys/Questionnaires", "Required for quantitative methods.")
+    
+    if "mixed method" in terms:
+        required_forms.setdefault("Appendix B: Written Informed Consent Form", f"Required for mixed methods in {lang_str}.")
+        required_forms.setdefault("Recruitment Materials (e.g., emails, flyers)", "Required for participant notification.")
+        if "interview" in terms or "focus group" in terms:
+            required_forms.setdefault("Appendix D: Oral Consent Script", f"Required if oral consent is used in {lang_str}.")
+            required_forms.setdefault("Interview Questions/Focus Group Guides", "Required for qualitative components.")
+        if "survey" in terms:
+            required_forms.setdefault("Surveys/Questionnaires", "Required for quantitative components.")
+    
+    if "genetic" in terms or "biobank" in terms:
+        required_forms.setdefault("Appendix M: Written Informed Consent Form For Genetic and/or Biobank Research", f"Required for genetic/biobank research in {lang_str}.")
+    
+    if "collaborator" in terms or "external organization" in terms:
+        required_forms.setdefault("Appendix L: Confidentiality Agreement Form", f"Required for external collaborators in {lang_str}.")
     
     if research_sites_text and "nazarbayev university" not in research_sites_text:
-        required_forms.append({"form": "Letters of Support/Approval from Outside Organizations", "reason": "Required for external sites."})
+        required_forms.setdefault("Letters of Support/Approval from Outside Organizations", "Required for external sites.")
     
-    if "visual stimuli" in methodology:
-        required_forms.append({"form": "Visual Stimuli", "reason": "Required if visual stimuli are presented."})
+    if "visual stimuli" in terms:
+        required_forms.setdefault("Visual Stimuli", "Required if visual stimuli are presented.")
     
-    if "attach" in part_3_text.lower() or "appendix" in part_3_text.lower():
+    part_3_lower = part_3_text.lower()
+    if "attach" in part_3_lower or "appendix" in part_3_lower:
         results["info"].append("References to attachments detected in Part 3.")
     else:
         results["warnings"].append("No references to attachments detected in Part 3.")
     
     return results, required_forms, methodology_text
 
-def validate_part_4(doc: docx.Document, required_forms: List[Dict]) -> Tuple[Dict[str, List[str]], List[Dict]]:
+def validate_part_4(sections: Dict[str, str], required_forms: Dict[str, str]) -> Tuple[Dict[str, List[str]], Dict[str, str]]:
     """Validates Part 4: Participants."""
-    results = {"errors": [], "warnings": [], "info": []}
-    part_4_text = ""
-    in_part_4 = False
-    
-    for para in doc.paragraphs:
-        if "Part 4: Participants" in para.text:
-            in_part_4 = True
-        if in_part_4:
-            part_4_text += para.text + "\n"
-        if "Part 5: Detailed Procedures" in para.text:
-            break
+    results, part_4_text = _open_section(sections, "Part 4")
     
     if not part_4_text:
-        results["errors"].append("Part 4: Participants section not found.")
         return results, required_forms
     
-    special_populations = [
-        ("Minors", r"Minors \(under 18 years of age\)\?.*?(Yes ☑|No ☑|Yes ☐|No ☐)"),
-        ("Legally incompetent", r"Legally incompetent\?.*?(Yes ☑|No ☑|Yes ☐|No ☐)"),
-        ("Prisoners", r"Prisoners\?.*?(Yes ☑|No ☑|Yes ☐|No ☐)"),
-        ("Perinatal women", r"Perinatal women.*?(Yes ☑|No ☑|Yes ☐|No ☐)"),
-        ("Institutionalized", r"Institutionalized\?.*?(Yes ☑|No ☑|Yes ☐|No ☐)"),
-        ("Mentally incapacitated", r"Mentally incapacitated\?.*?(Yes ☑|No ☑|Yes ☐|No ☐)"),
-        ("Sexual behaviors", r"Sexual behaviors\?.*?(Yes ☑|No ☑|Yes ☐|No ☐)"),
-        ("Drug use", r"Drug use\?.*?(Yes ☑|No ☑|Yes ☐|No ☐)"),
-        ("Illegal conduct", r"Illegal conduct\?.*?(Yes ☑|No ☑|Yes ☐|No ☐)"),
-        ("Use of alcohol", r"Use of alcohol\?.*?(Yes ☑|No ☑|Yes ☐|No ☐)")
-    ]
-    
     special_populations_yes = []
-    for pop_name, pattern in special_populations:
-        match = re.search(pattern, part_4_text, re.DOTALL)
-        if not match:
+    checkboxes = _checkbox_index(part_4_text)
+    na_checkboxes = _checkbox_index(part_4_text, _NA_CHECKBOX_RE)
+    for pop_name, prompt in _SPECIAL_POPULATIONS:
+        answer = _checkbox_answer(part_4_text, checkboxes, prompt, "any")
+        if not answer:
             results["errors"].append(f"Response to '{pop_name}' not found or improperly formatted.")
             continue
         
-        answer = match.group(1)
-        if "☐" in answer:
+        if answer.endswith("☐"):
             results["warnings"].append(f"Checkbox for '{pop_name}' is not marked (☐).")
         elif answer == "Yes ☑":
             special_populations_yes.append(pop_name)
             results["info"].append(f"Special population '{pop_name}' selected: Yes.")
             if pop_name == "Minors":
-                required_forms.extend([
-                    {"form": "Appendix E: Assent Form", "reason": "Required for minors in English, Russian, Kazakh."},
-                    {"form": "Parental Consent Forms", "reason": "Required for minors in English, Russian, Kazakh."}
-                ])
+                required_forms.setdefault("Appendix E: Assent Form", "Required for minors in English, Russian, Kazakh.")
+                required_forms.setdefault("Parental Consent Forms", "Required for minors in English, Russian, Kazakh.")
             else:
-                required_forms.append({"form": "Appendix B: Written Informed Consent Form", "reason": f"Required for special population '{pop_name}' in English, Russian, Kazakh."})
+                required_forms.setdefault("Appendix B: Written Informed Consent Form", f"Required for special population '{pop_name}' in English, Russian, Kazakh.")
                 if pop_name in ["Sexual behaviors", "Drug use", "Illegal conduct", "Use of alcohol"]:
-                    required_forms.append({"form": "Appendix L: Confidentiality Agreement Form", "reason": f"Recommended for sensitive subjects ('{pop_name}')."})
+                    required_forms.setdefault("Appendix L: Confidentiality Agreement Form", f"Recommended for sensitive subjects ('{pop_name}').")
         else:
             results["info"].append(f"Special population '{pop_name}' selected: No.")
     
-    other_special = re.search(r"Other \(please specify\)\s*([^\n]*)", part_4_text)
-    if other_special and other_special.group(1).strip():
-        results["info"].append(f"Other special population: {other_special.group(1).strip()}.")
-        required_forms.append({"form": "Appendix B: Written Informed Consent Form", "reason": "Required for other special populations."})
+    other_special = _match_text(_OTHER_SPECIAL_RE.search(part_4_text))
+    if other_special:
+        results["info"].append(f"Other special population: {other_special}.")
+        required_forms.setdefault("Appendix B: Written Informed Consent Form", "Required for other special populations.")
     
-    sample_size = re.search(r"Expected number of participants or sample size:\s*(\d+)", part_4_text)
+    sample_size = _SAMPLE_SIZE_RE.search(part_4_text)
     if not sample_size or not sample_size.group(1):
         results["errors"].append("Sample size is missing or invalid.")
     else:
         results["info"].append(f"Sample size: {sample_size.group(1)}.")
     
-    participant_fields = [
-        ("Languages of communication", r"Languages of communication:\s*([^\n]+)"),
-        ("Gender, race or ethnic group", r"Gender, race or ethnic group.*?:\s*([^\n]+)"),
-        ("Affiliation of participants", r"Affiliation of participants.*?:\s*([^\n]+)"),
-        ("Mental health", r"Participants’ general state of mental health:\s*([^\n]+)"),
-        ("Physical health", r"Participants’ general state of physical health:\s*([^\n]+)")
-    ]
-    
-    for field_name, pattern in participant_fields:
-        match = re.search(pattern, part_4_text)
-        if not match or not match.group(1).strip():
+    for field_name, pattern in _PARTICIPANT_FIELDS:
+        value = _match_text(pattern.search(part_4_text))
+        if not value:
             results["errors"].append(f"Field '{field_name}' is missing or empty.")
         else:
-            results["info"].append(f"Field '{field_name}' filled: {match.group(1).strip()}.")
+            results["info"].append(f"Field '{field_name}' filled: {value}.")
     
-    justification_na = re.search(r"Explain why you have chosen this particular group.*?\n.*?(N/A ☑|N/A ☐)", part_4_text, re.DOTALL)
-    justification_text = re.search(r"Explain why you have chosen this particular group.*?\n(.*?)(What is your relationship to the participants\?|$)", part_4_text, re.DOTALL)
+    justification_na, justification_text = _explanation(part_4_text, na_checkboxes, _JUSTIFICATION_PROMPT, _RELATIONSHIP_PROMPT)
     
-    if justification_na and justification_na.group(1) == "N/A ☑":
+    if justification_na == "N/A ☑":
         if special_populations_yes:
             results["errors"].append("Justification cannot be N/A when special populations are selected.")
         else:
             results["info"].append("Justification marked as N/A.")
-    elif justification_text and justification_text.group(1).strip():
+    elif justification_text:
         results["info"].append("Justification provided.")
     else:
         results["errors"].append("Justification is missing or empty.")
     
-    relationship = re.search(r"What is your relationship to the participants\?.*?\n(.*?)(Does your relationship potentially create any power|$)", part_4_text, re.DOTALL)
-    power_dynamics = re.search(r"Does your relationship potentially create any power.*?\n(.*?)(\n|$)", part_4_text, re.DOTALL)
+    relationship = _field_text(part_4_text, _RELATIONSHIP_PROMPT, _POWER_DYNAMICS_PROMPT)
+    power_dynamics = _field_text(part_4_text, _POWER_DYNAMICS_PROMPT, "\n")
     
-    if not relationship or not relationship.group(1).strip():
+    if not relationship:
         results["errors"].append("Relationship to participants is missing or empty.")
     else:
-        results["info"].append(f"Relationship: {relationship.group(1).strip()}.")
+        results["info"].append(f"Relationship: {relationship}.")
     
-    if not power_dynamics or not power_dynamics.group(1).strip():
+    if not power_dynamics:
         results["errors"].append("Power dynamics description is missing or empty.")
     else:
-        results["info"].append(f"Power dynamics: {power_dynamics.group(1).strip()}.")
+        results["info"].append(f"Power dynamics: {power_dynamics}.")
     
-    recruitment = re.search(r"Will participants be recruited\?.*?(Yes ☑|No ☑|Yes ☐|No ☐)", part_4_text)
-    contact_method_na = re.search(r"How will you contact potential participants.*?\n.*?(N/A ☑|N/A ☐)", part_4_text, re.DOTALL)
-    contact_method_text = re.search(r"How will you contact potential participants.*?\n(.*?)(Describe the method for recruiting participants|$)", part_4_text, re.DOTALL)
-    recruitment_method_na = re.search(r"Describe the method for recruiting participants.*?\n.*?(N/A ☑|N/A ☐)", part_4_text, re.DOTALL)
-    recruitment_method_text = re.search(r"Describe the method for recruiting participants.*?\n(.*?)(Exclusions:|$)", part_4_text, re.DOTALL)
+    recruitment = _checkbox_answer(part_4_text, checkboxes, _RECRUITMENT_PROMPT, "line")
+    contact_method_na, contact_method_text = _explanation(part_4_text, na_checkboxes, _CONTACT_METHOD_PROMPT, _RECRUITMENT_METHOD_PROMPT)
+    recruitment_method_na, recruitment_method_text = _explanation(part_4_text, na_checkboxes, _RECRUITMENT_METHOD_PROMPT, _EXCLUSIONS_PROMPT)
     
     if not recruitment:
         results["errors"].append("Recruitment question not found or improperly formatted.")
     else:
-        recruitment_answer = recruitment.group(1)
-        if "☐" in recruitment_answer:
+        if recruitment.endswith("☐"):
             results["warnings"].append("Recruitment checkbox is not marked (☐).")
-        elif recruitment_answer == "Yes ☑":
+        elif recruitment == "Yes ☑":
             results["info"].append("Participants will be recruited: Yes.")
-            required_forms.append({"form": "Recruitment Materials (e.g., emails, flyers)", "reason": "Required for recruitment."})
-            if contact_method_na and contact_method_na.group(1) == "N/A ☑":
+            required_forms.setdefault("Recruitment Materials (e.g., emails, flyers)", "Required for recruitment.")
+            if contact_method_na == "N/A ☑":
                 results["errors"].append("Contact method cannot be N/A when recruitment is Yes.")
-            elif not contact_method_text or not contact_method_text.group(1).strip():
+            elif not contact_method_text:
                 results["errors"].append("Contact method description is missing or empty.")
             else:
                 results["info"].append("Contact method description provided.")
             
-            if recruitment_method_na and recruitment_method_na.group(1) == "N/A ☑":
+            if recruitment_method_na == "N/A ☑":
                 results["errors"].append("Recruitment method cannot be N/A when recruitment is Yes.")
-            elif not recruitment_method_text or not recruitment_method_text.group(1).strip():
+            elif not recruitment_method_text:
                 results["errors"].append("Recruitment method description is missing or empty.")
             else:
                 results["info"].append("Recruitment method description provided.")
         else:
             results["info"].append("Participants will be recruited: No.")
-            if (contact_method_na and contact_method_na.group(1) != "N/A ☑") or (contact_method_text and contact_method_text.group(1).strip()):
+            if contact_method_na == "N/A ☐" or contact_method_text:
                 results["errors"].append("Contact method should be N/A when recruitment is No.")
-            if (recruitment_method_na and recruitment_method_na.group(1) != "N/A ☑") or (recruitment_method_text and recruitment_method_text.group(1).strip()):
+            if recruitment_method_na == "N/A ☐" or recruitment_method_text:
                 results["errors"].append("Recruitment method should be N/A when recruitment is No.")
     
-    exclusions_na = re.search(r"Exclusions:.*?\n.*?(N/A ☑|N/A ☐)", part_4_text, re.DOTALL)
-    exclusions_text = re.search(r"Exclusions:.*?\n(.*?)(Procedures in the event of a participant withdrawing|$)", part_4_text, re.DOTALL)
+    exclusions_na, exclusions_text = _explanation(part_4_text, na_checkboxes, _EXCLUSIONS_PROMPT, _WITHDRAWAL_PROMPT)
     
-    if exclusions_na and exclusions_na.group(1) == "N/A ☑":
+    if exclusions_na == "N/A ☑":
         results["info"].append("Exclusions marked as N/A.")
-    elif exclusions_text and exclusions_text.group(1).strip():
+    elif exclusions_text:
         results["info"].append("Exclusions description provided.")
     else:
         results["errors"].append("Exclusions description is missing or empty.")
     
-    withdrawal = re.search(r"Procedures in the event of a participant withdrawing.*?\n(.*?)(Part 5:|$)", part_4_text, re.DOTALL)
-    if not withdrawal or not withdrawal.group(1).strip():
+    withdrawal = _field_text(_section_body(part_4_text, "Part 5:"), _WITHDRAWAL_PROMPT, None)
+    if not withdrawal:
         results["errors"].append("Withdrawal procedures description is missing or empty.")
     else:
         results["info"].append("Withdrawal procedures description provided.")
     
     return results, required_forms
 
-def validate_part_5(doc: docx.Document, required_forms: List[Dict]) -> Tuple[Dict[str, List[str]], List[Dict], str]:
+def validate_part_5(sections: Dict[str, str], required_forms: Dict[str, str]) -> Tuple[Dict[str, List[str]], Dict[str, str], str]:
     """Validates Part 5: Detailed Procedures."""
-    results = {"errors": [], "warnings": [], "info": []}
-    part_5_text = ""
-    in_part_5 = False
-    
-    for para in doc.paragraphs:
-        if "Part 5: Detailed Procedures" in para.text:
-            in_part_5 = True
-        if in_part_5:
-            part_5_text += para.text + "\n"
-        if "Part 6: Data Management Plan" in para.text:
-            break
+    results, part_5_text = _open_section(sections, "Part 5")
     
     if not part_5_text:
-        results["errors"].append("Part 5: Detailed Procedures section not found.")
         return results, required_forms, ""
     
-    dates = re.search(r"When is the data collection for the research intended to begin and end\?.*?\n\s*(\d{2}/\d{4})\s*to\s*(\d{2}/\d{4})", part_5_text)
+    checkboxes = _checkbox_index(part_5_text)
+    na_checkboxes = _checkbox_index(part_5_text, _NA_CHECKBOX_RE)
+    dates = _DATA_COLLECTION_DATES_RE.search(part_5_text)
     if not dates:
         results["errors"].append("Data collection dates are missing or improperly formatted.")
     else:
@@ -696,514 +925,375 @@ def validate_part_5(doc: docx.Document, required_forms: List[Dict]) -> Tuple[Dic
             if delta > 12:
                 results["errors"].append("Data collection period exceeds one year.")
     
-    involvement = re.search(r"Describe how subjects will be involved in detail.*?\n(.*?)(Will you be the one administering|$)", part_5_text, re.DOTALL)
+    involvement = _field_text(part_5_text, _INVOLVEMENT_PROMPT, _ADMINISTRATION_PROMPT)
     involvement_text = ""
-    if not involvement or not involvement.group(1).strip():
+    if not involvement:
         results["errors"].append("Participant involvement description is missing or empty.")
     else:
-        involvement_text = involvement.group(1).strip()
+        involvement_text = involvement
         results["info"].append("Participant involvement description provided.")
         if "debriefing" in involvement_text.lower():
-            required_forms.append({"form": "Debriefing Documents", "reason": "Required if debriefing is part of the process."})
+            required_forms.setdefault("Debriefing Documents", "Required if debriefing is part of the process.")
     
-    administration = re.search(r"Will you be the one administering.*?\n(.*?)(Will the participants experience any discomfort|$)", part_5_text, re.DOTALL)
-    if not administration or not administration.group(1).strip():
+    administration = _field_text(part_5_text, _ADMINISTRATION_PROMPT, "Will the participants experience any discomfort")
+    if not administration:
         results["errors"].append("Data collection administration description is missing or empty.")
     else:
         results["info"].append("Data collection administration description provided.")
     
-    discomfort = re.search(r"Will the participants experience any discomfort\?.*?(Yes ☑|No ☑|Yes ☐|No ☐)", part_5_text)
-    discomfort_na = re.search(r"If “Yes”, please explain.*?\n.*?(N/A ☑|N/A ☐)", part_5_text, re.DOTALL)
-    discomfort_explanation = re.search(r"If “Yes”, please explain.*?\n(.*?)(Will deception or false or misleading|$)", part_5_text, re.DOTALL)
+    discomfort = _checkbox_answer(part_5_text, checkboxes, _DISCOMFORT_PROMPT, "line")
+    discomfort_na, discomfort_explanation = _explanation(part_5_text, na_checkboxes, _DISCOMFORT_EXPLANATION_PROMPT, "Will deception or false or misleading")
     
-    if not discomfort:
-        results["errors"].append("Discomfort question not found or improperly formatted.")
-    else:
-        discomfort_answer = discomfort.group(1)
-        if "☐" in discomfort_answer:
-            results["warnings"].append("Discomfort checkbox is not marked (☐).")
-        elif discomfort_answer == "Yes ☑":
-            results["info"].append("Discomfort: Yes.")
-            required_forms.append({"form": "Appendix B: Written Informed Consent Form", "reason": "Required for discomfort, with precautions."})
-            if discomfort_na and discomfort_na.group(1) == "N/A ☑":
-                results["errors"].append("Discomfort explanation cannot be N/A when discomfort is Yes.")
-            elif not discomfort_explanation or not discomfort_explanation.group(1).strip():
-                results["errors"].append("Discomfort explanation is missing or empty.")
-            else:
-                results["info"].append("Discomfort explanation provided.")
-        else:
-            results["info"].append("Discomfort: No.")
-            if discomfort_explanation and discomfort_explanation.group(1).strip():
-                results["warnings"].append("Discomfort explanation provided when discomfort is No.")
+    if _check_explained_answer(results, "Discomfort", discomfort, discomfort_explanation, discomfort_na):
+        required_forms.setdefault("Appendix B: Written Informed Consent Form", "Required for discomfort, with precautions.")
     
-    deception = re.search(r"Will deception or false or misleading information be used.*?\n.*?(Yes ☑|No ☑|Yes ☐|No ☐)", part_5_text, re.DOTALL)
-    deception_na = re.search(r"If “Yes”, explain why deception is necessary.*?\n.*?(N/A ☑|N/A ☐)", part_5_text, re.DOTALL)
-    deception_explanation = re.search(r"If “Yes”, explain why deception is necessary.*?\n(.*?)(Part 6:|$)", part_5_text, re.DOTALL)
+    deception = _checkbox_answer(part_5_text, checkboxes, _DECEPTION_PROMPT)
+    deception_na, deception_explanation = _explanation(_section_body(part_5_text, "Part 6:"), na_checkboxes, _DECEPTION_EXPLANATION_PROMPT, None)
     
-    if not deception:
-        results["errors"].append("Deception question not found or improperly formatted.")
-    else:
-        deception_answer = deception.group(1)
-        if "☐" in deception_answer:
-            results["warnings"].append("Deception checkbox is not marked (☐).")
-        elif deception_answer == "Yes ☑":
-            results["info"].append("Deception: Yes.")
-            required_forms.extend([
-                {"form": "Appendix B: Written Informed Consent Form", "reason": "Required for deception, with debriefing."},
-                {"form": "Debriefing Documents", "reason": "Required for deception."}
-            ])
-            if deception_na and deception_na.group(1) == "N/A ☑":
-                results["errors"].append("Deception explanation cannot be N/A when deception is Yes.")
-            elif not deception_explanation or not deception_explanation.group(1).strip():
-                results["errors"].append("Deception explanation is missing or empty.")
-            else:
-                results["info"].append("Deception explanation provided.")
-        else:
-            results["info"].append("Deception: No.")
-            if deception_explanation and deception_explanation.group(1).strip():
-                results["warnings"].append("Deception explanation provided when deception is No.")
+    if _check_explained_answer(results, "Deception", deception, deception_explanation, deception_na):
+        required_forms.setdefault("Appendix B: Written Informed Consent Form", "Required for deception, with debriefing.")
+        required_forms.setdefault("Debriefing Documents", "Required for deception.")
     
     return results, required_forms, involvement_text
 
-def validate_part_6(doc: docx.Document, required_forms: List[Dict]) -> Tuple[Dict[str, List[str]], List[Dict], str, str, str]:
+def validate_part_6(sections: Dict[str, str], required_forms: Dict[str, str]) -> Tuple[Dict[str, List[str]], Dict[str, str], str, str, str]:
     """Validates Part 6: Data Management Plan."""
-    results = {"errors": [], "warnings": [], "info": []}
-    part_6_text = ""
-    in_part_6 = False
-    
-    for para in doc.paragraphs:
-        if "Part 6: Data Management Plan" in para.text:
-            in_part_6 = True
-        if in_part_6:
-            part_6_text += para.text + "\n"
-        if "Part 7: Risk/Benefit Analysis" in para.text:
-            break
+    results, part_6_text = _open_section(sections, "Part 6")
     
     if not part_6_text:
-        results["errors"].append("Part 6: Data Management Plan section not found.")
         return results, required_forms, "", "", ""
     
-    electronic_survey = re.search(r"Are you conducting a survey using any electronic media\?.*?(Yes ☑|No ☑|Yes ☐|No ☐)", part_6_text)
+    checkboxes = _checkbox_index(part_6_text)
+    electronic_survey = _checkbox_answer(part_6_text, checkboxes, _ELECTRONIC_SURVEY_PROMPT, "line")
     if not electronic_survey:
         results["errors"].append("Electronic survey question not found or improperly formatted.")
         return results, required_forms, "", "", ""
     
-    survey_answer = electronic_survey.group(1)
-    if "☐" in survey_answer:
+    if electronic_survey.endswith("☐"):
         results["warnings"].append("Electronic survey checkbox is not marked (☐).")
         return results, required_forms, "", "", ""
     
-    results["info"].append(f"Electronic survey: {survey_answer}.")
-    if survey_answer == "Yes ☑":
-        required_forms.append({"form": "Appendix C: Informed Consent Form for Internet Surveys", "reason": "Required for internet surveys."})
+    results["info"].append(f"Electronic survey: {electronic_survey}.")
+    transmission = _field_text(part_6_text, _TRANSMISSION_PROMPT, _URL_PROMPT)
+    url = _line_after(part_6_text, _URL_PROMPT)
+    if electronic_survey == "Yes ☑":
+        required_forms.setdefault("Appendix C: Informed Consent Form for Internet Surveys", "Required for internet surveys.")
         
-        name_privacy = re.search(r"Will you assure that the participant will only see his/her name\?.*?(Yes ☑|No ☑|Yes ☐|No ☐)", part_6_text)
-        read_receipt = re.search(r"Will you have the “read receipt” function turned off\?.*?(Yes ☑|No ☑|Yes ☐|No ☐)", part_6_text)
-        email_explanation = re.search(r"If you answered “No” to these questions, please explain.*?\n(.*?)(If your survey contains questions|$)", part_6_text, re.DOTALL)
+        name_privacy = _checkbox_answer(part_6_text, checkboxes, _NAME_PRIVACY_PROMPT, "line")
+        read_receipt = _checkbox_answer(part_6_text, checkboxes, _READ_RECEIPT_PROMPT, "line")
+        email_explanation = _field_text(part_6_text, _EMAIL_EXPLANATION_PROMPT, "If your survey contains questions")
         
         if not name_privacy:
             results["errors"].append("Name privacy question not found or improperly formatted.")
         else:
-            results["info"].append(f"Name privacy: {name_privacy.group(1)}.")
+            results["info"].append(f"Name privacy: {name_privacy}.")
         
         if not read_receipt:
             results["errors"].append("Read receipt question not found or improperly formatted.")
         else:
-            results["info"].append(f"Read receipt: {read_receipt.group(1)}.")
+            results["info"].append(f"Read receipt: {read_receipt}.")
         
-        if (name_privacy and name_privacy.group(1) == "No ☑") or (read_receipt and read_receipt.group(1) == "No ☑"):
-            if not email_explanation or not email_explanation.group(1).strip():
+        if name_privacy == "No ☑" or read_receipt == "No ☑":
+            if not email_explanation:
                 results["errors"].append("Explanation for 'No' in email invitation questions is missing or empty.")
             else:
                 results["info"].append("Explanation for 'No' in email invitation provided.")
         
-        dropdown = re.search(r"Do they have the option to choose “No response”.*?(Yes ☑|No ☑|No dropdown menu ☑|Yes ☐|No ☐|No dropdown menu ☐)", part_6_text)
+        dropdown = _DROPDOWN_RE.search(part_6_text)
         if not dropdown:
             results["errors"].append("Dropdown menu question not found or improperly formatted.")
         else:
             results["info"].append(f"Dropdown menu: {dropdown.group(1)}.")
         
-        transmission = re.search(r"How will data be transmitted\?.*?\n(.*?)(What is the URL\?|$)", part_6_text, re.DOTALL)
-        if not transmission or not transmission.group(1).strip():
+        if not transmission:
             results["errors"].append("Data transmission description is missing or empty.")
         else:
             results["info"].append("Data transmission description provided.")
         
-        url = re.search(r"What is the URL\?.*?\n\s*([^\n]*)", part_6_text)
-        if not url or not url.group(1).strip():
+        if not url:
             results["errors"].append("URL is missing or empty for electronic survey.")
         else:
-            results["info"].append(f"Survey URL: {url.group(1).strip()}.")
+            results["info"].append(f"Survey URL: {url}.")
     
     else:
-        for field, pattern in [
-            ("Name privacy", r"Will you assure that the participant will only see his/her name\?.*?(Yes ☑|No ☑|Yes ☐|No ☐)"),
-            ("Read receipt", r"Will you have the “read receipt” function turned off\?.*?(Yes ☑|No ☑|Yes ☐|No ☐)"),
-            ("Dropdown menu", r"Do they have the option to choose “No response”.*?(Yes ☑|No ☑|No dropdown menu ☑|Yes ☐|No ☐|No dropdown menu ☐)"),
-            ("Data transmission", r"How will data be transmitted\?.*?\n(.*?)(What is the URL\?|$)"),
-            ("URL", r"What is the URL\?.*?\n\s*([^\n]*)")
-        ]:
-            match = re.search(pattern, part_6_text, re.DOTALL)
-            if match and ((field in ["Name privacy", "Read receipt", "Dropdown menu"] and match.group(1) not in ["Yes ☐", "No ☐", "No dropdown menu ☐"]) or
-                         (field in ["Data transmission", "URL"] and match.group(1).strip())):
+        for field, prompt in _NO_SURVEY_CHECKBOXES:
+            answer = _checkbox_answer(part_6_text, checkboxes, prompt, "any")
+            if answer and answer.endswith("☑"):
+                results["errors"].append(f"{field} should be unanswered or empty when electronic survey is No.")
+        dropdown = _NO_SURVEY_DROPDOWN_RE.search(part_6_text)
+        if dropdown and dropdown.group(1) not in ["Yes ☐", "No ☐", "No dropdown menu ☐"]:
+            results["errors"].append("Dropdown menu should be unanswered or empty when electronic survey is No.")
+        for field, value in (("Data transmission", transmission), ("URL", url)):
+            if value:
                 results["errors"].append(f"{field} should be unanswered or empty when electronic survey is No.")
     
-    storage = re.search(r"Where will data be stored\?.*?\n\s*([^\n]*)", part_6_text)
+    storage = _line_after(part_6_text, _STORAGE_PROMPT)
     storage_text = ""
-    if not storage or not storage.group(1).strip():
+    if not storage:
         results["errors"].append("Data storage description is missing or empty.")
     else:
-        storage_text = storage.group(1).strip()
+        storage_text = storage
         results["info"].append(f"Data storage: {storage_text}.")
     
-    maintenance = re.search(r"How will data be maintained\?.*?\n(.*?)(Will data be shared\?|$)", part_6_text, re.DOTALL)
+    maintenance = _field_text(part_6_text, _MAINTENANCE_PROMPT, _SHARING_PROMPT)
     maintenance_text = ""
-    if not maintenance or not maintenance.group(1).strip():
+    if not maintenance:
         results["errors"].append("Data maintenance description is missing or empty.")
     else:
-        maintenance_text = maintenance.group(1).strip()
+        maintenance_text = maintenance
         results["info"].append(f"Data maintenance: {maintenance_text}.")
         if "identifiable" in maintenance_text.lower():
-            required_forms.append({"form": "Appendix L: Confidentiality Agreement Form", "reason": "Recommended for identifiable data."})
+            required_forms.setdefault("Appendix L: Confidentiality Agreement Form", "Recommended for identifiable data.")
     
-    sharing = re.search(r"Will data be shared\?.*?(Yes ☑|No ☑|Yes ☐|No ☐)", part_6_text)
-    sharing_details = re.search(r"How\? With whom\? Will subjects be re-identifiable\? Why or why not\?.*?\n(.*?)(Describe the data security plan|$)", part_6_text, re.DOTALL)
+    sharing = _checkbox_answer(part_6_text, checkboxes, _SHARING_PROMPT, "line")
+    sharing_details = _field_text(part_6_text, _SHARING_DETAILS_PROMPT, _SECURITY_PROMPT)
     sharing_text = ""
     
     if not sharing:
         results["errors"].append("Data sharing question not found or improperly formatted.")
     else:
-        sharing_answer = sharing.group(1)
-        if "☐" in sharing_answer:
+        if sharing.endswith("☐"):
             results["warnings"].append("Data sharing checkbox is not marked (☐).")
         else:
-            results["info"].append(f"Data sharing: {sharing_answer}.")
-            if not sharing_details or not sharing_details.group(1).strip():
+            results["info"].append(f"Data sharing: {sharing}.")
+            if not sharing_details:
                 results["errors"].append("Data sharing details are missing or empty.")
             else:
-                sharing_text = sharing_details.group(1).strip()
+                sharing_text = sharing_details
                 results["info"].append(f"Data sharing details: {sharing_text}.")
-                if sharing_answer == "Yes ☑" and "identifiable" in sharing_text.lower():
-                    required_forms.append({"form": "Appendix L: Confidentiality Agreement Form", "reason": "Required for sharing identifiable data."})
+                if sharing == "Yes ☑" and "identifiable" in sharing_text.lower():
+                    required_forms.setdefault("Appendix L: Confidentiality Agreement Form", "Required for sharing identifiable data.")
     
-    security = re.search(r"Describe the data security plan.*?\n(.*?)(Part 7:|$)", part_6_text, re.DOTALL)
-    if not security or not security.group(1).strip():
+    security = _field_text(_section_body(part_6_text, "Part 7:"), _SECURITY_PROMPT, None)
+    if not security:
         results["errors"].append("Data security plan description is missing or empty.")
     else:
-        results["info"].append(f"Data security plan: {security.group(1).strip()}.")
+        results["info"].append(f"Data security plan: {security}.")
     
     return results, required_forms, maintenance_text, sharing_text, storage_text
 
-def validate_part_7(doc: docx.Document, required_forms: List[Dict]) -> Tuple[Dict[str, List[str]], List[Dict]]:
+def validate_part_7(sections: Dict[str, str], required_forms: Dict[str, str]) -> Tuple[Dict[str, List[str]], Dict[str, str]]:
     """Validates Part 7: Risk/Benefit Analysis."""
-    results = {"errors": [], "warnings": [], "info": []}
-    part_7_text = ""
-    in_part_7 = False
-    
-    for para in doc.paragraphs:
-        if "Part 7: Risk/Benefit Analysis" in para.text:
-            in_part_7 = True
-        if in_part_7:
-            part_7_text += para.text + "\n"
-        if "Part 8: Confidentiality/Anonymity" in para.text:
-            break
+    results, part_7_text = _open_section(sections, "Part 7")
     
     if not part_7_text:
-        results["errors"].append("Part 7: Risk/Benefit Analysis section not found.")
         return results, required_forms
     
-    minimal_risk = re.search(r"Do you believe those risks will be no greater than minimal\?.*?(Yes ☑|No ☑|Yes ☐|No ☐)", part_7_text)
-    minimal_risk_explanation = re.search(r"Explain why:.*?\n(.*?)(Describe all risks|$)", part_7_text, re.DOTALL)
+    checkboxes = _checkbox_index(part_7_text)
+    minimal_risk = _checkbox_answer(part_7_text, checkboxes, _MINIMAL_RISK_PROMPT, "line")
+    minimal_risk_explanation = _field_text(part_7_text, _MINIMAL_RISK_EXPLANATION_PROMPT, _RISKS_PROMPT)
     
     if not minimal_risk:
         results["errors"].append("Minimal risk question not found or improperly formatted.")
     else:
-        minimal_risk_answer = minimal_risk.group(1)
-        if "☐" in minimal_risk_answer:
+        if minimal_risk.endswith("☐"):
             results["warnings"].append("Minimal risk checkbox is not marked (☐).")
         else:
-            results["info"].append(f"Minimal risk: {minimal_risk_answer}.")
+            results["info"].append(f"Minimal risk: {minimal_risk}.")
         
-        if not minimal_risk_explanation or not minimal_risk_explanation.group(1).strip():
+        if not minimal_risk_explanation:
             results["errors"].append("Minimal risk explanation is missing or empty.")
         else:
             results["info"].append("Minimal risk explanation provided.")
     
-    risks = re.search(r"Describe all risks.*?\n(.*?)(If risks are greater than minimal|$)", part_7_text, re.DOTALL)
-    if not risks or not risks.group(1).strip():
+    risks = _field_text(part_7_text, _RISKS_PROMPT, "If risks are greater than minimal")
+    if not risks:
         results["errors"].append("Risks description is missing or empty.")
     else:
-        risks_text = risks.group(1).strip()
-        if risks_text.lower() in ["not applicable", "no risk"]:
+        if risks.lower() in ["not applicable", "no risk"]:
             results["errors"].append("Risks description cannot be 'Not Applicable' or 'No risk'.")
         else:
-            results["info"].append(f"Risks description: {risks_text}.")
-    
-    if minimal_risk and minimal_risk.group(1) == "No ☑":
-        required_forms.append({"form": "Appendix B: Written Informed Consent Form", "reason": "Required for greater than minimal risk."})
-        risk_fields = [
-            ("Why risks are essential", r"Explain why these risks are essential.*?\n(.*?)(What have you done to minimize risks|$)", part_7_text),
-            ("Minimize risks", r"What have you done to minimize risks.*?\n(.*?)(What protections have you put in place|$)", part_7_text),
-            ("Protections", r"What protections have you put in place.*?\n(.*?)(What procedures have you established|$)", part_7_text),
-            ("Adverse events reporting", r"What procedures have you established for reporting adverse events.*?\n(.*?)(Will the participants directly|$)", part_7_text)
-        ]
-        
-        for field_name, pattern, text in risk_fields:
-            match = re.search(pattern, text, re.DOTALL)
-            if not match or not match.group(1).strip():
+            results["info"].append(f"Risks description: {risks}.")
+    
+    if minimal_risk == "No ☑":
+        required_forms.setdefault("Appendix B: Written Informed Consent Form", "Required for greater than minimal risk.")
+        pos = 0
+        for field_name, prompt, next_prompt in _RISK_FIELDS:
+            value, pos = _field_span(part_7_text, prompt, next_prompt, pos)
+            if not value:
                 results["errors"].append(f"{field_name} description is missing or empty.")
             else:
                 results["info"].append(f"{field_name} description provided.")
     
-    participant_benefits = re.search(r"Will the participants directly or indirectly benefit.*?\n.*?(Yes ☑|No ☑|Yes ☐|No ☐)", part_7_text, re.DOTALL)
-    benefits_explanation = re.search(r"Please explain:.*?\n(.*?)(What are the anticipated benefits to society|$)", part_7_text, re.DOTALL)
+    participant_benefits = _checkbox_answer(part_7_text, checkboxes, _PARTICIPANT_BENEFITS_PROMPT)
+    benefits_explanation = _field_text(part_7_text, _BENEFITS_EXPLANATION_PROMPT, _SOCIETAL_BENEFITS_PROMPT)
     
     if not participant_benefits:
         results["errors"].append("Participant benefits question not found or improperly formatted.")
     else:
-        benefits_answer = participant_benefits.group(1)
-        if "☐" in benefits_answer:
+        if participant_benefits.endswith("☐"):
             results["warnings"].append("Participant benefits checkbox is not marked (☐).")
         else:
-            results["info"].append(f"Participant benefits: {benefits_answer}.")
-            if not benefits_explanation or not benefits_explanation.group(1).strip():
+            results["info"].append(f"Participant benefits: {participant_benefits}.")
+            if not benefits_explanation:
                 results["errors"].append("Participant benefits explanation is missing or empty.")
             else:
                 results["info"].append("Participant benefits explanation provided.")
-                if benefits_answer == "Yes ☑":
-                    required_forms.append({
-                        "form": "Appendix B: Written Informed Consent Form",
-                        "reason": "Required to detail participant benefits."
-                    })
-    
-    societal_benefits = re.search(r"What are the anticipated benefits to society.*?\n(.*?)(Will incentives be offered|$)", part_7_text, re.DOTALL)
-    if not societal_benefits or not societal_benefits.group(1).strip():
+                if participant_benefits == "Yes ☑":
+                    required_forms.setdefault("Appendix B: Written Informed Consent Form", "Required to detail participant benefits.")
+    
+    societal_benefits = _field_text(part_7_text, _SOCIETAL_BENEFITS_PROMPT, _INCENTIVES_PROMPT)
+    if not societal_benefits:
         results["errors"].append("Societal benefits description is missing or empty.")
     else:
         results["info"].append("Societal benefits description provided.")
     
-    incentives = re.search(r"Will incentives be offered.*?\n.*?(Yes ☑|No ☑|Yes ☐|No ☐)", part_7_text, re.DOTALL)
-    incentives_details = re.search(r"If “Yes”, please describe.*?\n(.*?)(Part 8:|$)", part_7_text, re.DOTALL)
+    incentives = _checkbox_answer(part_7_text, checkboxes, _INCENTIVES_PROMPT)
+    incentives_details = _field_text(_section_body(part_7_text, "Part 8:"), _INCENTIVES_DETAILS_PROMPT, None)
     
-    if not incentives:
-        results["errors"].append("Incentives question not found or improperly formatted.")
-    else:
-        incentives_answer = incentives.group(1)
-        if "☐" in incentives_answer:
-            results["warnings"].append("Incentives checkbox is not marked (☐).")
-        elif incentives_answer == "Yes ☑":
-            results["info"].append("Incentives: Yes.")
-            required_forms.append({
-                "form": "Appendix B: Written Informed Consent Form",
-                "reason": "Required for incentives, with details."
-            })
-            if not incentives_details or not incentives_details.group(1).strip():
-                results["errors"].append("Incentives description is missing or empty.")
-            else:
-                results["info"].append("Incentives description provided.")
-        else:
-            results["info"].append("Incentives: No.")
-            if incentives_details and incentives_details.group(1).strip():
-                results["warnings"].append("Incentives description provided when incentives is No.")
+    if _check_explained_answer(results, "Incentives", incentives, incentives_details, noun="description"):
+        required_forms.setdefault("Appendix B: Written Informed Consent Form", "Required for incentives, with details.")
     
     return results, required_forms
 
-def validate_part_8(doc: docx.Document, required_forms: List[Dict], methodology_text: str, involvement_text: str, maintenance_text: str, sharing_text: str, storage_text: str) -> Tuple[Dict[str, List[str]], List[Dict]]:
+def validate_part_8(sections: Dict[str, str], required_forms: Dict[str, str], methodology_text: str, involvement_text: str, maintenance_text: str, sharing_text: str, storage_text: str) -> Tuple[Dict[str, List[str]], Dict[str, str]]:
     """Validates Part 8: Confidentiality/Anonymity with consistency checks."""
-    results = {"errors": [], "warnings": [], "info": []}
-    part_8_text = ""
-    in_part_8 = False
-    
-    for para in doc.paragraphs:
-        if "Part 8: Confidentiality/Anonymity" in para.text:
-            in_part_8 = True
-        if in_part_8:
-            part_8_text += para.text + "\n"
-        if "Part 10: Project Funding" in para.text:
-            break
+    results, part_8_text = _open_section(sections, "Part 8")
     
     if not part_8_text:
-        results["errors"].append("Part 8: Confidentiality/Anonymity section not found.")
         return results, required_forms
     
-    recordings = re.search(r"Will you be video recording.*?\n.*?(Yes ☑|No ☑|Yes ☐|No ☐)", part_8_text, re.DOTALL)
+    checkboxes = _checkbox_index(part_8_text)
+    na_checkboxes = _checkbox_index(part_8_text, _NA_CHECKBOX_RE)
+    recordings = _checkbox_answer(part_8_text, checkboxes, _RECORDINGS_PROMPT)
     if not recordings:
         results["errors"].append("Recordings question not found or improperly formatted.")
     else:
-        recordings_answer = recordings.group(1)
-        if "☐" in recordings_answer:
+        if recordings.endswith("☐"):
             results["warnings"].append("Recordings checkbox is not marked (☐).")
         else:
-            results["info"].append(f"Video/Photograph/Audio Recordings: {recordings_answer}.")
-            if recordings_answer == "Yes ☑":
-                required_forms.append({
-                    "form": "Appendix B: Written Informed Consent Form",
-                    "reason": "Required for recordings."
-                })
+            results["info"].append(f"Video/Photograph/Audio Recordings: {recordings}.")
+            if recordings == "Yes ☑":
+                required_forms.setdefault("Appendix B: Written Informed Consent Form", "Required for recordings.")
             
             # Consistency check with Parts 3 and 5
-            recording_terms = ["video", "audio", "photograph", "recording", "interview via video"]
-            if any(term in methodology_text.lower() for term in recording_terms) or any(term in involvement_text.lower() for term in recording_terms):
-                if recordings_answer != "Yes ☑":
+            if _RECORDING_TERMS_RE.search(methodology_text.lower()) or _RECORDING_TERMS_RE.search(involvement_text.lower()):
+                if recordings != "Yes ☑":
                     results["errors"].append("Part 8.1 should be 'Yes' as Parts 3 or 5 mention video/audio/photograph.")
-            elif recordings_answer == "Yes ☑":
+            elif recordings == "Yes ☑":
                 results["warnings"].append("Part 8.1 is 'Yes' but no video/audio/photograph mentioned in Parts 3 or 5.")
     
-    consent_recordings = re.search(r"Will you be obtaining signed consent forms.*?\n.*?(Yes ☑|No ☑|Yes ☐|No ☐)", part_8_text, re.DOTALL)
+    consent_recordings = _checkbox_answer(part_8_text, checkboxes, _CONSENT_RECORDINGS_PROMPT)
     if not consent_recordings:
         results["errors"].append("Consent for recordings question not found or improperly formatted.")
     else:
-        consent_answer = consent_recordings.group(1)
-        if "☐" in consent_answer:
+        if consent_recordings.endswith("☐"):
             results["warnings"].append("Consent for recordings checkbox is not marked (☐).")
         else:
-            results["info"].append(f"Consent for recordings: {consent_answer}.")
-            if recordings_answer == "Yes ☑" and consent_answer != "Yes ☑":
+            results["info"].append(f"Consent for recordings: {consent_recordings}.")
+            if recordings == "Yes ☑" and consent_recordings != "Yes ☑":
                 results["errors"].append("Consent for recordings must be 'Yes' when recordings is 'Yes'.")
-            if recordings_answer == "No ☑" and consent_answer == "Yes ☑":
+            if recordings == "No ☑" and consent_recordings == "Yes ☑":
                 results["errors"].append("Consent for recordings should be 'No' or unanswered when recordings is 'No'.")
     
-    identifiability = re.search(r"Will the data be identifiable.*?\n.*?(Yes ☑|No ☑|Yes ☐|No ☐)", part_8_text, re.DOTALL)
-    identifiability_explanation = re.search(r"If “Yes”, please explain.*?\n(.*?)(Describe procedures to create/preserve anonymity|$)", part_8_text, re.DOTALL)
+    identifiability = _checkbox_answer(part_8_text, checkboxes, _IDENTIFIABILITY_PROMPT)
+    identifiability_explanation = _field_text(part_8_text, _IDENTIFIABILITY_EXPLANATION_PROMPT, _ANONYMITY_PROMPT)
     
     if not identifiability:
         results["errors"].append("Identifiability question not found or improperly formatted.")
     else:
-        identifiability_answer = identifiability.group(1)
-        if "☐" in identifiability_answer:
+        if identifiability.endswith("☐"):
             results["warnings"].append("Identifiability checkbox is not marked (☐).")
         else:
-            results["info"].append(f"Identifiability: {identifiability_answer}.")
-            if identifiability_answer == "Yes ☑":
-                required_forms.append({
-                    "form": "Appendix L: Confidentiality Agreement Form",
-                    "reason": "Required for identifiable data."
-                })
-                if not identifiability_explanation or not identifiability_explanation.group(1).strip():
+            results["info"].append(f"Identifiability: {identifiability}.")
+            # Evaluated once for both branches; any() stops at the first Part 6 text that mentions it
+            part_6_identifiable = any("identifiable" in text.lower() for text in (maintenance_text, sharing_text, storage_text))
+            if identifiability == "Yes ☑":
+                required_forms.setdefault("Appendix L: Confidentiality Agreement Form", "Required for identifiable data.")
+                if not identifiability_explanation:
                     results["errors"].append("Identifiability explanation is missing or empty when identifiability is Yes.")
                 else:
                     results["info"].append("Identifiability explanation provided.")
                 
                 # Consistency check with Part 6
-                if any("identifiable" in text.lower() for text in [maintenance_text, sharing_text, storage_text]):
+                if part_6_identifiable:
                     results["info"].append("Identifiability in Part 8 is consistent with Part 6.")
                 else:
                     results["warnings"].append("Part 8.3 is 'Yes' but Part 6 does not mention identifiable data.")
-            else:
-                if any("identifiable" in text.lower() for text in [maintenance_text, sharing_text, storage_text]):
-                    results["errors"].append("Part 8.3 should be 'Yes' as Part 6 mentions identifiable data.")
+            elif part_6_identifiable:
+                results["errors"].append("Part 8.3 should be 'Yes' as Part 6 mentions identifiable data.")
     
-    anonymity_na = re.search(r"Describe procedures to create/preserve anonymity.*?\n.*?(N/A ☑|N/A ☐)", part_8_text, re.DOTALL)
-    anonymity_procedures = re.search(r"Describe procedures to create/preserve anonymity.*?\n(.*?)(Describe procedures to preserve confidentiality|$)", part_8_text, re.DOTALL)
+    anonymity_na, anonymity_procedures = _explanation(part_8_text, na_checkboxes, _ANONYMITY_PROMPT, _CONFIDENTIALITY_PROMPT)
     
-    if identifiability_answer == "No ☑":
-        if anonymity_na and anonymity_na.group(1) == "N/A ☑":
+    if identifiability == "No ☑":
+        if anonymity_na == "N/A ☑":
             results["errors"].append("Anonymity procedures cannot be N/A when identifiability is No.")
-        elif not anonymity_procedures or not anonymity_procedures.group(1).strip():
+        elif not anonymity_procedures:
             results["errors"].append("Anonymity procedures description is missing or empty when identifiability is No.")
         else:
             results["info"].append("Anonymity procedures description provided.")
-    else:
-        if anonymity_na and anonymity_na.group(1) != "N/A ☑":
+    elif identifiability == "Yes ☑":
+        if anonymity_na == "N/A ☐":
             results["errors"].append("Anonymity procedures should be N/A when identifiability is Yes.")
-        if anonymity_procedures and anonymity_procedures.group(1).strip():
+        if anonymity_procedures:
             results["errors"].append("Anonymity procedures should be empty when identifiability is Yes.")
     
-    confidentiality_fields = [
-        ("During data collection", r"During data collection.*?\n(.*?)(While results are analyzed|$)", part_8_text),
-        ("While results are analyzed", r"While results are analyzed.*?\n(.*?)(In publication/reporting|$)", part_8_text),
-        ("In publication/reporting", r"In publication/reporting.*?\n(.*?)(In storage after research completion|$)", part_8_text),
-        ("In storage after research completion", r"In storage after research completion.*?\n(.*?)(Part 10:|$)", part_8_text)
-    ]
+    part_8_body = _section_body(part_8_text, "Part 10:")
+    confidentiality = []
+    pos = 0
+    for field_name, next_prompt in _CONFIDENTIALITY_FIELDS:
+        value, pos = _field_span(part_8_body, field_name, next_prompt, pos)
+        confidentiality.append((field_name, value))
     
-    if identifiability_answer == "Yes ☑":
-        for field_name, pattern, text in confidentiality_fields:
-            match = re.search(pattern, text, re.DOTALL)
-            if not match or not match.group(1).strip():
+    if identifiability == "Yes ☑":
+        for field_name, value in confidentiality:
+            if not value:
                 results["errors"].append(f"Confidentiality procedures for '{field_name}' are missing or empty.")
             else:
                 results["info"].append(f"Confidentiality procedures for '{field_name}' provided.")
-    else:
-        for field_name, pattern, text in confidentiality_fields:
-            match = re.search(pattern, text, re.DOTALL)
-            if match and match.group(1).strip():
+    elif identifiability == "No ☑":
+        for field_name, value in confidentiality:
+            if value:
                 results["warnings"].append(f"Confidentiality procedures for '{field_name}' should be empty when identifiability is No.")
     
     return results, required_forms
 
-def validate_part_10(doc: docx.Document, required_forms: List[Dict]) -> Tuple[Dict[str, List[str]], List[Dict]]:
+def validate_part_10(sections: Dict[str, str], required_forms: Dict[str, str]) -> Tuple[Dict[str, List[str]], Dict[str, str]]:
     """Validates Part 10: Project Funding."""
-    results = {"errors": [], "warnings": [], "info": []}
-    part_10_text = ""
-    in_part_10 = False
-    
-    for para in doc.paragraphs:
-        if "Part 10: Project Funding" in para.text:
-            in_part_10 = True
-        if in_part_10:
-            part_10_text += para.text + "\n"
-        if "Part 11: Protocol for naming of documents" in para.text:
-            break
+    results, part_10_text = _open_section(sections, "Part 10")
     
     if not part_10_text:
-        results["errors"].append("Part 10: Project Funding section not found.")
         return results, required_forms
     
-    funding = re.search(r"Is this project being supported by any funding sources\?.*?(Yes ☑|No ☑|Yes ☐|No ☐)", part_10_text)
+    checkboxes = _checkbox_index(part_10_text)
+    funding = _checkbox_answer(part_10_text, checkboxes, _FUNDING_PROMPT, "line")
     if not funding:
         results["errors"].append("Funding question not found or improperly formatted.")
     else:
-        funding_answer = funding.group(1)
-        if "☐" in funding_answer:
+        if funding.endswith("☐"):
             results["warnings"].append("Funding checkbox is not marked (☐).")
         else:
-            results["info"].append(f"Project funding: {funding_answer}.")
-            if funding_answer == "Yes ☑":
-                source = re.search(r"If yes, please specify the funding source\(s\):.*?\n(.*?)(Is the funding external|$)", part_10_text, re.DOTALL)
-                external = re.search(r"Is the funding external to Nazarbayev University\?.*?(Yes ☑|No ☑|Yes ☐|No ☐)", part_10_text)
-                
-                if not source or not source.group(1).strip():
+            results["info"].append(f"Project funding: {funding}.")
+            source = _field_text(part_10_text, _FUNDING_SOURCE_PROMPT, "Is the funding external")
+            external = _checkbox_answer(part_10_text, checkboxes, _EXTERNAL_FUNDING_PROMPT, "line")
+            if funding == "Yes ☑":
+                if not source:
                     results["errors"].append("Funding source description is missing or empty.")
                 else:
-                    results["info"].append(f"Funding source: {source.group(1).strip()}.")
+                    results["info"].append(f"Funding source: {source}.")
                 
                 if not external:
                     results["errors"].append("External funding question not found or improperly formatted.")
                 else:
-                    external_answer = external.group(1)
-                    if "☐" in external_answer:
+                    if external.endswith("☐"):
                         results["warnings"].append("External funding checkbox is not marked (☐).")
                     else:
-                        results["info"].append(f"External funding: {external_answer}.")
-                        if external_answer == "Yes ☑":
-                            required_forms.append({
-                                "form": "Appendix K: Funding Source Form",
-                                "reason": "Required for external funding."
-                            })
+                        results["info"].append(f"External funding: {external}.")
+                        if external == "Yes ☑":
+                            required_forms.setdefault("Appendix K: Funding Source Form", "Required for external funding.")
             else:
-                source = re.search(r"If yes, please specify the funding source\(s\):.*?\n(.*?)(Is the funding external|$)", part_10_text, re.DOTALL)
-                external = re.search(r"Is the funding external to Nazarbayev University\?.*?(Yes ☑|No ☑|Yes ☐|No ☐)", part_10_text)
-                if source and source.group(1).strip():
+                if source:
                     results["errors"].append("Funding source should be empty when funding is No.")
-                if external and external.group(1) not in ["Yes ☐", "No ☐"]:
+                if external and external.endswith("☑"):
                     results["errors"].append("External funding question should be unanswered when funding is No.")
     
     return results, required_forms
 
-def validate_part_11_and_checklist(doc: docx.Document, required_forms: List[Dict], pi_surname: str, file_names: Optional[List[str]] = None) -> Tuple[Dict[str, List[str]], List[Dict]]:
+def validate_part_11_and_checklist(sections: Dict[str, str], required_forms: Dict[str, str], pi_surname: str, file_names: Optional[List[str]] = None) -> Tuple[Dict[str, List[str]], Dict[str, str]]:
     """Validates Part 11: Protocol for naming of documents and Checklist."""
-    results = {"errors": [], "warnings": [], "info": []}
-    part_11_text = ""
-    in_part_11 = False
-    
-    for para in doc.paragraphs:
-        if "Part 11: Protocol for naming of documents" in para.text:
-            in_part_11 = True
-        if in_part_11:
-            part_11_text += para.text + "\n"
+    results, part_11_text = _open_section(sections, "Part 11")
     
     if not part_11_text:
-        results["errors"].append("Part 11: Protocol for naming of documents section not found.")
         return results, required_forms
     
     # Validate document naming protocol
@@ -1227,25 +1317,24 @@ def validate_part_11_and_checklist(doc: docx.Document, required_forms: List[Dict
                 results["errors"].append("Main application file (Surname_IREC Application_MMDDYYYY) not found in provided file names.")
     
     # Validate checklist
-    checklist_start = re.search(r"CHECKLIST\s*Please indicate which forms.*?\n", part_11_text, re.DOTALL)
+    checklist_start = _CHECKLIST_START_RE.search(part_11_text)
     if not checklist_start:
         results["errors"].append("Checklist section not found in Part 11.")
         return results, required_forms
     
     checklist_text = part_11_text[checklist_start.end():]
     
-    # Extract all checklist items
-    checklist_items = re.findall(r"([^\n]+?)\s*(☑|☐)\s*(?:\n|$)", checklist_text, re.DOTALL)
-    if not checklist_items:
+    # Map each checklist item to its checkbox; without any box character there is nothing to match
+    checked_forms = {}
+    if "☑" in checklist_text or "☐" in checklist_text:
+        checked_forms = {match.group(1).strip(): match.group(2) for match in _CHECKLIST_ITEM_RE.finditer(checklist_text)}
+    if not checked_forms:
         results["errors"].append("No checklist items found in Part 11.")
         return results, required_forms
     
-    # Create a set of checked forms
-    checked_forms = {item.strip(): status for item, status in checklist_items}
-    
     # Validate required forms
-    for required_form in required_forms:
-        form_name = required_form["form"].strip()
+    required_form_names = [form_name.strip() for form_name in required_forms]
+    for form_name in required_form_names:
         if form_name not in checked_forms:
             results["errors"].append(f"Required form '{form_name}' not listed in checklist.")
         elif checked_forms[form_name] != "☑":
@@ -1254,14 +1343,14 @@ def validate_part_11_and_checklist(doc: docx.Document, required_forms: List[Dict
             results["info"].append(f"Required form '{form_name}' is correctly checked (☑).")
     
     # Check for unnecessary forms
-    required_form_names = {form["form"].strip() for form in required_forms}
+    required_form_set = set(required_form_names)
     for form_name, status in checked_forms.items():
-        if form_name not in required_form_names and status == "☑":
+        if form_name not in required_form_set and status == "☑":
             results["warnings"].append(f"Form '{form_name}' is checked but not required.")
     
     return results, required_forms
 
-def validate_irec_application(doc: docx.Document, file_names: Optional[List[str]] = None) -> Dict[str, any]:
+def validate_irec_application(doc: "docx.Document", file_names: Optional[List[str]] = None) -> Dict[str, any]:
     """
     Validates the entire NU IREC application by calling validation functions for each part.
     Returns a consolidated report with submission ID, timestamp, and validation results.
@@ -1273,53 +1362,55 @@ def validate_irec_application(doc: docx.Document, file_names: Optional[List[str]
         "summary": {"errors": 0, "warnings": 0, "info": 0}
     }
     
-    required_forms = [
-        {"form": "Appendix A: IREC Application Form", "reason": "Required for all submissions."},
-        {"form": "CITI Training Certificates", "reason": "Required for all team members."}
-    ]
+    sections = split_sections(doc)
+    
+    required_forms = {
+        "Appendix A: IREC Application Form": "Required for all submissions.",
+        "CITI Training Certificates": "Required for all team members."
+    }
     
     # Validate Part 0
-    part_0_results, exemption_claimed = validate_part_0(doc)
+    part_0_results, exemption_claimed = validate_part_0(sections)
     results["parts"]["Part 0"] = part_0_results
     
     # Validate Part 1
-    part_1_results = validate_part_1(doc, exemption_claimed)
+    part_1_results = validate_part_1(sections, exemption_claimed)
     results["parts"]["Part 1"] = part_1_results
     
     # Validate Part 2 and extract PI surname
-    part_2_results, pi_surname = validate_part_2(doc)
+    part_2_results, pi_surname = validate_part_2(sections)
     results["parts"]["Part 2"] = part_2_results
     
     # Validate Part 3
-    part_3_results, required_forms, methodology_text = validate_part_3(doc)
+    part_3_results, required_forms, methodology_text = validate_part_3(sections)
     results["parts"]["Part 3"] = part_3_results
     
     # Validate Part 4
-    part_4_results, required_forms = validate_part_4(doc, required_forms)
+    part_4_results, required_forms = validate_part_4(sections, required_forms)
     results["parts"]["Part 4"] = part_4_results
     
     # Validate Part 5
-    part_5_results, required_forms, involvement_text = validate_part_5(doc, required_forms)
+    part_5_results, required_forms, involvement_text = validate_part_5(sections, required_forms)
     results["parts"]["Part 5"] = part_5_results
     
     # Validate Part 6
-    part_6_results, required_forms, maintenance_text, sharing_text, storage_text = validate_part_6(doc, required_forms)
+    part_6_results, required_forms, maintenance_text, sharing_text, storage_text = validate_part_6(sections, required_forms)
     results["parts"]["Part 6"] = part_6_results
     
     # Validate Part 7
-    part_7_results, required_forms = validate_part_7(doc, required_forms)
+    part_7_results, required_forms = validate_part_7(sections, required_forms)
     results["parts"]["Part 7"] = part_7_results
     
     # Validate Part 8
-    part_8_results, required_forms = validate_part_8(doc, required_forms, methodology_text, involvement_text, maintenance_text, sharing_text, storage_text)
+    part_8_results, required_forms = validate_part_8(sections, required_forms, methodology_text, involvement_text, maintenance_text, sharing_text, storage_text)
     results["parts"]["Part 8"] = part_8_results
     
     # Validate Part 10
-    part_10_results, required_forms = validate_part_10(doc, required_forms)
+    part_10_results, required_forms = validate_part_10(sections, required_forms)
     results["parts"]["Part 10"] = part_10_results
     
     # Validate Part 11 and Checklist
-    part_11_results, required_forms = validate_part_11_and_checklist(doc, required_forms, pi_surname, file_names)
+    part_11_results, required_forms = validate_part_11_and_checklist(sections, required_forms, pi_surname, file_names)
     results["parts"]["Part 11"] = part_11_results
     
     # Summarize results
@@ -1329,11 +1420,13 @@ def validate_irec_application(doc: docx.Document, file_names: Optional[List[str]
         results["summary"]["info"] += len(part_results["info"])
     
     # Add list of required forms to results
-    results["required_forms"] = required_forms
+    results["required_forms"] = [{"form": form, "reason": reason} for form, reason in required_forms.items()]
     
     return results
 
 if __name__ == "__main__":
+    import docx
+    
     # Example usage
     try:
         doc = docx.Document("irec_application.docx")
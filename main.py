@@ -1,8 +1,7 @@
 from fastapi import FastAPI, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
 from docx import Document
-import tempfile
-import shutil
+from io import BytesIO
 import irec  # ← теперь имя файла с проверками
 
 app = FastAPI()
@@ -16,15 +15,17 @@ app.add_middleware(
 
 @app.post("/check-doc/")
 async def check_doc(file: UploadFile = File(...)):
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".docx") as tmp:
-        shutil.copyfileobj(file.file, tmp)
-        tmp_path = tmp.name
+    # Разбираем загруженный файл в памяти, без временного файла на диске
+    doc = Document(BytesIO(await file.read()))
+    sections = irec.split_sections(doc)
 
-    doc = Document(tmp_path)
-
-    # Базовая проверка — можно добавить больше
-    part0_results, exemption = irec.validate_part_0(doc)
-    part1_results = irec.validate_part_1(doc, exemption)
+    # Части вызываются по отдельности, а не через irec.validate_irec_application:
+    # ответ API сохраняет форму {"part0": ..., "part1": ...}, на которую рассчитан фронтенд
+    part0_results, exemption = irec.validate_part_0(sections)
+    # Без Part 0 это не заявка IREC — дальше не проверяем
+    if not sections["Part 0"]:
+        return {"part0": part0_results}
+    part1_results = irec.validate_part_1(sections, exemption)
 
     return {
         "part0": part0_results,
@@ -0,0 +1,274 @@
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+
+import irec
+
+
+def _doc(*lines):
+    """Builds a stand-in for a docx.Document: split_sections only reads paragraph text."""
+    return SimpleNamespace(paragraphs=[SimpleNamespace(text=line) for line in lines])
+
+
+def _pi_blocks(text):
+    return irec._parse_blocks(text, irec._PI_HEADER, (irec._RA_HEADER, irec._AI_HEADER, irec._STUDENTS_HEADER))
+
+
+def _ai_blocks(text):
+    return irec._parse_blocks(text, irec._AI_HEADER, (irec._STUDENTS_HEADER,), header_anywhere=True)
+
+
+class ParseBlocksTest(unittest.TestCase):
+    def test_checkbox_on_question_line_keeps_next_field(self):
+        blocks = _pi_blocks(
+            "Principal Investigator\n"
+            "Name: John Smith\n"
+            "Have you completed the CITI basic course? Yes ☑ No ☐\n"
+            "CITI Training completion date: 01/15/2025\n"
+            "Research Advisor:\n"
+        )
+        self.assertEqual(blocks[0]["CITI status"], "Yes ☑")
+        self.assertEqual(blocks[0]["CITI Training completion date"], "01/15/2025")
+
+    def test_fields_before_pending_answer_are_parsed(self):
+        blocks = _pi_blocks(
+            "Principal Investigator\n"
+            "Name: John Smith\n"
+            "Have you completed the CITI basic course?\n"
+            "CITI Training completion date: 01/15/2025\n"
+            "No ☑\n"
+        )
+        self.assertEqual(blocks[0]["CITI status"], "No ☑")
+        self.assertEqual(blocks[0]["CITI Training completion date"], "01/15/2025")
+
+    def test_ai_header_with_trailing_text_opens_block(self):
+        blocks = _ai_blocks(
+            "Additional Investigator(s): (add rows as needed)\n"
+            "Name: Ann Lee\n"
+            "E-mail address: ann@nu.edu.kz\n"
+            "For students:\n"
+        )
+        self.assertEqual(len(blocks), 1)
+        self.assertEqual(blocks[0]["Name"], "Ann Lee")
+
+    def test_pi_header_must_end_its_line(self):
+        self.assertEqual(_pi_blocks("Principal Investigator: John Smith\nName: John Smith\n"), [])
+
+    def test_status_prefers_marked_box_over_position(self):
+        for line, expected in (("Yes ☑ No ☐", "Yes ☑"), ("Yes ☐ No ☑", "No ☑"), ("Yes ☐ No ☐", "Yes ☐")):
+            blocks = _ai_blocks(
+                "Additional Investigator(s):\n"
+                "Name: Ann Lee\n"
+                "Have you completed the CITI basic course?\n"
+                f"{line}\n"
+            )
+            self.assertEqual(blocks[0]["CITI status"], expected, line)
+
+    def test_name_must_follow_header(self):
+        blocks = _pi_blocks("Principal Investigator\n\nNU ID: 123\nName: John Smith\n")
+        self.assertNotIn("Name", blocks[0])
+        self.assertEqual(blocks[0]["NU ID"], "123")
+
+    def test_end_marker_closes_block(self):
+        blocks = _pi_blocks("Principal Investigator\nName: John Smith\nResearch Advisor:\nNU ID: 456\n")
+        self.assertNotIn("NU ID", blocks[0])
+
+
+class SplitSectionsTest(unittest.TestCase):
+    def test_sections_include_next_header(self):
+        sections = irec.split_sections(_doc(
+            "Part 0: Do I Submit an NU IREC Application?",
+            "answer",
+            "Part 1: Cover Sheet",
+            "cover",
+        ))
+        self.assertEqual(sections["Part 0"], "Part 0: Do I Submit an NU IREC Application?\nanswer\nPart 1: Cover Sheet\n")
+        self.assertEqual(sections["Part 1"], "Part 1: Cover Sheet\ncover\n")
+
+    def test_missing_header_maps_to_empty(self):
+        sections = irec.split_sections(_doc("Part 1: Cover Sheet", "cover"))
+        self.assertEqual(sections["Part 0"], "")
+        self.assertEqual(sections["Part 2"], "")
+        self.assertEqual(set(sections), {key for key, _, _, _ in irec._SECTIONS})
+
+    def test_missing_end_header_runs_to_document_end(self):
+        sections = irec.split_sections(_doc("Part 10: Project Funding", "funding", "tail"))
+        self.assertEqual(sections["Part 10"], "Part 10: Project Funding\nfunding\ntail\n")
+
+    def test_out_of_order_headers_give_empty_section(self):
+        sections = irec.split_sections(_doc("Part 1: Cover Sheet", "cover", "Part 0: Do I Submit an NU IREC Application?"))
+        self.assertEqual(sections["Part 0"], "")
+
+    def test_part_1_does_not_shadow_part_10(self):
+        sections = irec.split_sections(_doc("Part 10: Project Funding", "funding", "Part 11: Protocol for naming of documents"))
+        self.assertEqual(sections["Part 1"], "")
+        self.assertTrue(sections["Part 10"].startswith("Part 10: Project Funding"))
+
+
+class CheckboxAnswerTest(unittest.TestCase):
+    def answer(self, text, scope):
+        return irec._checkbox_answer(text, irec._checkbox_index(text), "Question?", scope)
+
+    def test_answer_on_prompt_line(self):
+        text = "Question? Yes ☑ No ☐\nNext? No ☑\n"
+        self.assertEqual(self.answer(text, "line"), "Yes ☑")
+        self.assertEqual(self.answer(text, "any"), "Yes ☑")
+        # "below" starts after the prompt's line, like the old 'prompt.*?\n.*?(box)' patterns
+        self.assertEqual(self.answer(text, "below"), "No ☑")
+
+    def test_answer_on_next_line(self):
+        text = "Question?\nNo ☑\n"
+        self.assertEqual(self.answer(text, "below"), "No ☑")
+        self.assertEqual(self.answer(text, "any"), "No ☑")
+        self.assertIsNone(self.answer(text, "line"))
+
+    def test_answer_two_lines_down(self):
+        text = "Question?\nPlease tick one:\nYes ☐\n"
+        self.assertEqual(self.answer(text, "any"), "Yes ☐")
+        # The DOTALL patterns "below" replaces crossed any number of lines
+        self.assertEqual(self.answer(text, "below"), "Yes ☐")
+        self.assertIsNone(self.answer(text, "line"))
+
+    def test_line_scope_tries_later_prompt_occurrences(self):
+        text = "Question? (see notes)\nNo ☐\nQuestion? No ☑\n"
+        self.assertEqual(self.answer(text, "line"), "No ☑")
+
+    def test_missing_prompt(self):
+        text = "Other question? Yes ☑\nNo ☐\n"
+        for scope in ("below", "line", "any"):
+            self.assertIsNone(self.answer(text, scope), scope)
+
+    def test_prompt_on_last_line_without_answer(self):
+        self.assertIsNone(self.answer("Yes ☑\nQuestion?", "below"))
+
+    def test_na_index(self):
+        text = "Explain:\nN/A ☑\n"
+        index = irec._checkbox_index(text, irec._NA_CHECKBOX_RE)
+        self.assertEqual(irec._checkbox_answer(text, index, "Explain:"), "N/A ☑")
+
+
+class FieldTextTest(unittest.TestCase):
+    def test_answer_runs_up_to_next_prompt(self):
+        text = "Describe it (max 100 words)\nFirst line\nSecond line\nNext question\nOther\n"
+        self.assertEqual(irec._field_text(text, "Describe it", "Next question"), "First line\nSecond line")
+
+    def test_missing_next_prompt_runs_to_end(self):
+        text = "Describe it\nAnswer\nTail\n"
+        self.assertEqual(irec._field_text(text, "Describe it", "Next question"), "Answer\nTail")
+        self.assertEqual(irec._field_text(text, "Describe it", None), "Answer\nTail")
+
+    def test_prompt_at_end_without_newline(self):
+        text = "Intro\nDescribe it"
+        self.assertEqual(irec._field_text(text, "Describe it", "Next question"), "")
+        self.assertEqual(irec._line_after(text, "Describe it"), "")
+
+    def test_empty_answer(self):
+        text = "Describe it\n   \nNext question\n"
+        self.assertEqual(irec._field_text(text, "Describe it", "Next question"), "")
+
+    def test_missing_prompt(self):
+        self.assertEqual(irec._field_text("Other\ntext\n", "Describe it", None), "")
+        self.assertEqual(irec._line_after("Other\ntext\n", "Describe it"), "")
+
+    def test_field_span_offsets(self):
+        text = "A?\none\nB?\ntwo\n"
+        value, pos = irec._field_span(text, "A?", "B?")
+        self.assertEqual((value, pos), ("one", 2))
+        self.assertEqual(irec._field_span(text, "B?", None, pos), ("two", text.index("B?") + 2))
+        # A missing prompt leaves the offset where it was
+        self.assertEqual(irec._field_span(text, "C?", None, pos), ("", pos))
+
+    def test_line_after_skips_blank_lines(self):
+        text = "URL:\n\n  https://example.org  \nmore\n"
+        self.assertEqual(irec._line_after(text, "URL:"), "https://example.org")
+
+    def test_text_after_includes_rest_of_prompt_line(self):
+        self.assertEqual(irec._text_after("Why exempt: because\nreasons\n", "Why exempt:"), "because\nreasons")
+        self.assertEqual(irec._text_after("nothing here", "Why exempt:"), "")
+
+
+class FileNameTest(unittest.TestCase):
+    def test_application_form(self):
+        self.assertEqual(
+            irec.validate_file_name("Smith_IREC Application_01012025.docx", "Smith"),
+            (True, "Application form naming is valid."),
+        )
+
+    def test_document(self):
+        self.assertEqual(
+            irec.validate_file_name("Smith_Consent form-Kz_01012025.pdf", "Smith"),
+            (True, "File 'Smith_Consent form-Kz_01012025.pdf' naming is valid (Description: Consent form-Kz, Language: Kz)."),
+        )
+
+    def test_training_certificate(self):
+        for name in ("Smith_CITI_01012025.pdf", "Smith_TRREE_01012025"):
+            valid, message = irec.validate_file_name(name, "Smith")
+            self.assertTrue(valid, name)
+            self.assertEqual(message, f"Ethics training certificate naming is valid for '{name.rsplit('.', 1)[0]}'.")
+
+    def test_names_close_to_several_patterns(self):
+        # Only the whole name decides the kind: these start like an application form
+        # or a certificate but carry a language tag, so they are documents
+        cases = {
+            "Smith_IREC Application-Eng_01012025.docx": "IREC Application-Eng",
+            "Smith_IREC Application_01012025-Eng_01012025.docx": "IREC Application_01012025-Eng",
+            "Smith_CITI-Ru_01012025.pdf": "CITI-Ru",
+        }
+        for name, description in cases.items():
+            valid, message = irec.validate_file_name(name, "Smith")
+            self.assertTrue(valid, name)
+            self.assertIn(f"(Description: {description}, ", message)
+            self.assertEqual(irec._FILE_NAME_RE.fullmatch(name.rsplit(".", 1)[0], len("Smith_")).lastgroup, "document")
+
+    def test_surname_mismatch(self):
+        for name in ("Jones_CITI_01012025.pdf", "SmithCITI_01012025.pdf", "smith_CITI_01012025.pdf"):
+            self.assertEqual(
+                irec.validate_file_name(name, "Smith"),
+                (False, f"File '{name}' does not follow naming protocol."),
+            )
+
+    def test_invalid_name(self):
+        for name in ("Smith_Consent_01012025.pdf", "Smith_Consent-De_01012025.pdf", "Smith_CITI_0101205.pdf"):
+            self.assertFalse(irec.validate_file_name(name, "Smith")[0], name)
+
+
+class DateFormatTest(unittest.TestCase):
+    @staticmethod
+    def strptime(date_str):
+        try:
+            return datetime.strptime(date_str, "%m/%Y")
+        except ValueError:
+            return None
+
+    def test_fast_path_matches_strptime(self):
+        cases = (
+            "01/2024", "12/1999", "00/2024", "13/2024", "1/2024", " 01/2024", "01/2024 ",
+            "01-2024", "01/0000", "01/24", "+1/2024", "01/+024", "\u0660\u0661/\u0662\u0660\u0662\u0664", "01/\uff12\uff10\uff12\uff14", "",
+        )
+        for date_str in cases:
+            self.assertEqual(irec.validate_date_format(date_str), self.strptime(date_str), repr(date_str))
+
+    def test_other_format(self):
+        self.assertEqual(irec.validate_date_format("15/01/2024", "%d/%m/%Y"), datetime(2024, 1, 15))
+        self.assertIsNone(irec.validate_date_format("01/2024", "%d/%m/%Y"))
+
+
+class ChecklistItemTest(unittest.TestCase):
+    def items(self, text):
+        return [(match.group(1).strip(), match.group(2)) for match in irec._CHECKLIST_ITEM_RE.finditer(text)]
+
+    def test_item_at_line_start(self):
+        self.assertEqual(
+            self.items("Appendix A ☑\n  Consent form ☐  \nLast item ☐"),
+            [("Appendix A", "☑"), ("Consent form", "☐"), ("Last item", "☐")],
+        )
+
+    def test_box_in_middle_of_line_is_not_an_item(self):
+        self.assertEqual(self.items("Tick ☑ if attached\nAppendix A ☑\n"), [("Appendix A", "☑")])
+
+    def test_only_the_trailing_box_ends_an_item(self):
+        self.assertEqual(self.items("text ☑ Appendix B ☐\n"), [("text ☑ Appendix B", "☐")])
+
+
+if __name__ == "__main__":
+    unittest.main()